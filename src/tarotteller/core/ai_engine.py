@@ -2,33 +2,177 @@
 
 from __future__ import annotations
 
+import copy
+import io
 import json
 import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from collections.abc import Callable, Sequence
 from datetime import datetime, timezone
-from hashlib import sha256
+from functools import lru_cache
+from hashlib import blake2b, sha256
 from pathlib import Path
-from typing import Any, Dict, List, Mapping
+from typing import IO, Any, Dict, List, Mapping
 import re
 
 _LOG_PATH = Path("tarotteller-ai.log")
+_LOG_BATCH_SIZE = 32
+_LOG_FLUSH_INTERVAL = 5.0
+_CACHE_MODES = ("deterministic", "always", "off")
+_PROMPT_STATIC_HEAD = (
+    "You are Tarot Teller, an expert tarot reader who writes grounded,"
+    " compassionate interpretations that align with the supplied deck metadata.\n"
+    "Generate a narrative that weaves the querent's question with the cards"
+    " drawn in the spread.\n"
+    "\n"
+)
+_PROMPT_STATIC_FOOT = (
+    "\n"
+    "\n"
+    "Respond strictly in JSON with the shape: "
+    "{""summary"": str, ""tone"": str, ""card_insights"": "
+    "[{""card"": str, ""position"": str, ""message"": str, ""orientation"": str}]}\n"
+    "Keep the tone consistent with the deck descriptions."
+    " Each card insight must focus on actionable guidance."
+)
+_PLACEMENT_TEMPLATE = (
+    "- {position}: {card_name} ({orientation}) | prompt: {prompt} | keywords: {keywords}"
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+_BRACKET_RE = re.compile(r"[<>`]+")
+
+
+@lru_cache(maxsize=1)
+def _json_decoder() -> Callable[[Any], Any]:
+    # orjson is optional and only needed once a response is decoded, so it is
+    # imported lazily to keep it off the GUI and CLI startup path.
+    try:  # pragma: no cover - optional dependency
+        import orjson
+    except ImportError:  # pragma: no cover - optional dependency
+        return json.loads
+    return orjson.loads  # pragma: no cover - optional dependency
+
+
+def _json_loads(content: Any) -> Any:
+    return _json_decoder()(content)
 
 
 def _sanitize_text(text: str, *, max_length: int = 800) -> str:
     """Return ``text`` stripped of control characters and HTML brackets."""
 
-    collapsed = re.sub(r"\s+", " ", text).strip()
-    collapsed = re.sub(r"[<>`]+", "", collapsed)
+    # Clean text (no control whitespace, doubled spaces or brackets) only
+    # needs trimming, so skip both regex passes.
+    if (
+        text.isprintable()
+        and "  " not in text
+        and "<" not in text
+        and ">" not in text
+        and "`" not in text
+    ):
+        collapsed = text.strip()
+    else:
+        collapsed = _WHITESPACE_RE.sub(" ", text).strip()
+        collapsed = _BRACKET_RE.sub("", collapsed)
     if len(collapsed) > max_length:
         return collapsed[: max_length - 3].rstrip() + "..."
     return collapsed
 
 
+def _is_mapping(value: Any) -> bool:
+    # Payloads are almost always plain dicts; only consult the ABC otherwise.
+    return type(value) is dict or isinstance(value, Mapping)
+
+
+def _is_sequence(value: Any) -> bool:
+    if type(value) in (list, tuple):
+        return True
+    return isinstance(value, Sequence) and not isinstance(value, (str, bytes))
+
+
+def _format_placement(placement: Mapping[str, Any]) -> str:
+    card_name = str(placement.get("card_name") or placement.get("card") or "Unknown Card")
+    position = str(placement.get("position") or placement.get("title") or "Position")
+    orientation = str(placement.get("orientation") or "upright")
+    prompt = _sanitize_text(str(placement.get("prompt", "")))
+    keywords = placement.get("keywords")
+    if _is_sequence(keywords):
+        keyword_text = ", ".join(map(str, keywords))
+    else:
+        keyword_text = str(keywords or "")
+    return _PLACEMENT_TEMPLATE.format_map(
+        {
+            "position": position,
+            "card_name": card_name,
+            "orientation": orientation,
+            "prompt": prompt,
+            "keywords": keyword_text,
+        }
+    )
+
+
 def _ensure_log_path(path: Path) -> None:
     if path.parent and not path.parent.exists():
         path.parent.mkdir(parents=True, exist_ok=True)
 
 
+class _AuditLog:
+    """Buffered append-only writer for the AI audit trail.
+
+    Records are written once ``batch_size`` of them are queued, or when a timer
+    armed by the first buffered record fires ``flush_interval`` seconds later.
+    """
+
+    def __init__(self, path: Path, *, batch_size: int, flush_interval: float) -> None:
+        self.path = path
+        self._batch_size = max(1, int(batch_size))
+        self._flush_interval = flush_interval
+        self._buffer: List[str] = []
+        self._timer: threading.Timer | None = None
+        self._handle: IO[str] | None = None
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger(__name__)
+
+    def append(self, record: str) -> None:
+        with self._lock:
+            self._buffer.append(record)
+            if len(self._buffer) >= self._batch_size:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self._flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+    def _flush_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._buffer:
+            return
+        try:
+            if self._handle is None:
+                _ensure_log_path(self.path)
+                self._handle = self.path.open("a", encoding="utf-8")
+            self._handle.write("".join(self._buffer))
+            self._handle.flush()
+        except OSError:  # pragma: no cover - logging failures should not crash
+            self._logger.exception("Failed to write AI audit log entry")
+        self._buffer.clear()
+
+
 class AIEngine:
     """Interface wrapper for Codex / LLM powered tarot interpretations."""
 
@@ -39,12 +183,30 @@ class AIEngine:
         *,
         client: Callable[..., Any] | None = None,
         log_path: Path | None = None,
+        cache_mode: str = "deterministic",
+        cache_size: int = 512,
+        log_batch_size: int = _LOG_BATCH_SIZE,
     ) -> None:
+        if cache_mode not in _CACHE_MODES:
+            raise ValueError(
+                f"cache_mode must be one of {', '.join(_CACHE_MODES)}"
+            )
         self.model = model
         self.temperature = float(temperature)
         self._client = client
         self._logger = logging.getLogger(__name__)
         self._log_path = log_path or _LOG_PATH
+        self._audit_log = _AuditLog(
+            self._log_path,
+            batch_size=log_batch_size,
+            flush_interval=_LOG_FLUSH_INTERVAL,
+        )
+        # Flush the buffered tail when the engine is collected or at exit.
+        weakref.finalize(self, self._audit_log.close)
+        self._cache_mode = cache_mode
+        self._cache_size = max(0, int(cache_size))
+        self._cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._timestamp_cache: tuple[int, str] = (-1, "")
 
     def generate_reading(
         self,
@@ -57,7 +219,7 @@ class AIEngine:
             raise ValueError("question must be provided for AI-assisted readings")
         sanitized_question = _sanitize_text(question)
 
-        if isinstance(spread, Mapping):
+        if _is_mapping(spread):
             placements: Sequence[Mapping[str, Any]] = spread.get("placements", [])  # type: ignore[assignment]
         else:
             placements = spread
@@ -65,13 +227,41 @@ class AIEngine:
             raise ValueError("spread data must include at least one placement")
 
         prompt = self._compose_prompt(sanitized_question, placements, spread)
+        cache_key = self._cache_key(prompt)
+        if cache_key is not None and cache_key in self._cache:
+            self._cache.move_to_end(cache_key)
+            cached = copy.deepcopy(self._cache[cache_key])
+            self._audit_record(sanitized_question, placements, {"response_id": "cached"})
+            return cached
+
         response = self._call_model(prompt)
         parsed = self._parse_response(response)
+        if cache_key is not None:
+            self._cache[cache_key] = copy.deepcopy(parsed)
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
         self._audit_record(sanitized_question, placements, parsed)
         return parsed
 
+    def clear_cache(self) -> None:
+        """Forget every cached model response."""
+
+        self._cache.clear()
+
+    def flush_audit_log(self) -> None:
+        """Write any buffered audit records to disk."""
+
+        self._audit_log.flush()
+
     # ------------------------------------------------------------------
     # Internal helpers
+    def _cache_key(self, prompt: str) -> str | None:
+        if self._cache_size == 0 or self._cache_mode == "off":
+            return None
+        if self._cache_mode == "deterministic" and self.temperature != 0:
+            return None
+        return sha256(f"{self.model}|{self.temperature}|{prompt}".encode("utf-8")).hexdigest()
+
     def _compose_prompt(
         self,
         question: str,
@@ -80,50 +270,33 @@ class AIEngine:
     ) -> str:
         spread_title = "Custom Spread"
         spread_description = ""
-        if isinstance(spread_payload, Mapping):
+        if _is_mapping(spread_payload):
             spread_info = spread_payload.get("spread", {})
-            if isinstance(spread_info, Mapping):
+            if _is_mapping(spread_info):
                 spread_title = str(spread_info.get("name", spread_title))
                 spread_description = str(spread_info.get("description", ""))
 
-        lines: List[str] = []
-        lines.append(
-            "You are Tarot Teller, an expert tarot reader who writes grounded,"
-            " compassionate interpretations that align with the supplied deck metadata."
-        )
-        lines.append(
-            "Generate a narrative that weaves the querent's question with the cards"
-            " drawn in the spread."
-        )
-        lines.append("")
-        lines.append(f"Question: {question}")
-        lines.append(f"Spread: {spread_title} - {spread_description}".strip())
-        lines.append("Cards and positions:")
+        buffer = io.StringIO()
+        write = buffer.write
+        write(_PROMPT_STATIC_HEAD)
+        write(f"Question: {question}\n")
+        write(f"Spread: {spread_title} - {spread_description}".strip())
+        write("\nCards and positions:")
         for placement in placements:
-            card_name = str(placement.get("card_name") or placement.get("card") or "Unknown Card")
-            position = str(placement.get("position") or placement.get("title") or "Position")
-            orientation = str(placement.get("orientation") or "upright")
-            prompt = _sanitize_text(str(placement.get("prompt", "")))
-            keywords = placement.get("keywords")
-            if isinstance(keywords, Sequence) and not isinstance(keywords, (str, bytes)):
-                keyword_text = ", ".join(str(keyword) for keyword in keywords)
-            else:
-                keyword_text = str(keywords or "")
-            lines.append(
-                f"- {position}: {card_name} ({orientation}) | prompt: {prompt}"
-                f" | keywords: {keyword_text}"
-            )
-        lines.append("")
-        lines.append(
-            "Respond strictly in JSON with the shape: "
-            "{""summary"": str, ""tone"": str, ""card_insights"": "
-            "[{""card"": str, ""position"": str, ""message"": str, ""orientation"": str}]}"
-        )
-        lines.append(
-            "Keep the tone consistent with the deck descriptions."
-            " Each card insight must focus on actionable guidance."
-        )
-        return "\n".join(lines)
+            write("\n")
+            write(_format_placement(placement))
+        write(_PROMPT_STATIC_FOOT)
+        return buffer.getvalue()
+
+    def _timestamp(self) -> str:
+        # Audit records have second resolution, so format each second once.
+        epoch = int(time.time())
+        cached_epoch, cached_iso = self._timestamp_cache
+        if epoch == cached_epoch:
+            return cached_iso
+        iso = datetime.fromtimestamp(epoch, timezone.utc).isoformat(timespec="seconds")
+        self._timestamp_cache = (epoch, iso)
+        return iso
 
     def _call_model(self, prompt: str) -> Any:
         if self._client is not None:
@@ -150,15 +323,15 @@ class AIEngine:
             raise RuntimeError("AI service response did not include content")
         return first_output.content[0].text
 
-    def _parse_response(self, response: Any) -> Dict[str, Any]:
-        if isinstance(response, Mapping) and "choices" in response:
+    def _decode_payload(self, response: Any, response_is_mapping: bool) -> Any:
+        if response_is_mapping and "choices" in response:
             # Legacy ChatCompletion style payload
             choices = response.get("choices", [])
             if not choices:
                 raise ValueError("Model response contained no choices")
             message = choices[0].get("message", {})
             content = message.get("content", "")
-        elif isinstance(response, Mapping) and "output" in response:
+        elif response_is_mapping and "output" in response:
             output = response.get("output", [])
             if not output:
                 raise ValueError("Model response contained no output content")
@@ -170,10 +343,18 @@ class AIEngine:
             content = str(response)
 
         try:
-            payload = json.loads(content)
-        except json.JSONDecodeError as exc:
+            return _json_loads(content)
+        except ValueError as exc:  # json and orjson decode errors subclass ValueError
             raise ValueError("Model response was not valid JSON") from exc
 
+    def _parse_response(self, response: Any) -> Dict[str, Any]:
+        response_is_mapping = _is_mapping(response)
+        if response_is_mapping and "summary" in response and "card_insights" in response:
+            # In-process clients may hand back the decoded payload directly.
+            payload = response
+        else:
+            payload = self._decode_payload(response, response_is_mapping)
+
         summary = str(payload.get("summary", "")).strip()
         tone = str(payload.get("tone", "balanced")).strip() or "balanced"
         card_insights = payload.get("card_insights", [])
@@ -184,7 +365,7 @@ class AIEngine:
 
         normalized: List[Dict[str, Any]] = []
         for index, entry in enumerate(card_insights, start=1):
-            if not isinstance(entry, Mapping):
+            if not _is_mapping(entry):
                 raise ValueError("Each card insight must be an object")
             card = str(entry.get("card") or entry.get("card_name") or "").strip()
             message = str(entry.get("message") or entry.get("insight") or "").strip()
@@ -222,21 +403,19 @@ class AIEngine:
         placements: Sequence[Mapping[str, Any]],
         parsed: Mapping[str, Any],
     ) -> None:
-        question_hash = sha256(question.encode("utf-8")).hexdigest()[:16]
-        card_list = ";".join(
-            f"{placement.get('card_name') or placement.get('card')}|"
-            f"{placement.get('orientation', 'upright')}"
+        question_hash = blake2b(question.encode("utf-8"), digest_size=8).hexdigest()
+        pairs = tuple(
+            (
+                placement.get("card_name") or placement.get("card"),
+                placement.get("orientation", "upright"),
+            )
             for placement in placements
         )
+        card_list = ";".join(f"{name}|{orientation}" for name, orientation in pairs)
         response_id = parsed.get("response_id", "local")
-        timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        timestamp = self._timestamp()
         record = f"{timestamp},{self.model},{question_hash},{card_list},{response_id}\n"
-        try:
-            _ensure_log_path(self._log_path)
-            with self._log_path.open("a", encoding="utf-8") as handle:
-                handle.write(record)
-        except OSError:  # pragma: no cover - logging failures should not crash
-            self._logger.exception("Failed to write AI audit log entry")
+        self._audit_log.append(record)
 
 
 __all__ = ["AIEngine"]
@@ -21,6 +21,7 @@ _TIMEFRAME_KEYWORDS = {
     ),
 }
 
+_TERM_RE = re.compile(r"[A-Za-z']+")
 _POSITIVE_KEYWORDS = {"confident", "ready", "excited", "hope", "optimistic", "eager"}
 _NEGATIVE_KEYWORDS = {
     "worried",
@@ -52,9 +53,8 @@ def _normalise_question(question: str) -> str:
     return " ".join(question.strip().split())
 
 
-def _extract_terms(question: str) -> List[str]:
-    tokens = re.findall(r"[A-Za-z']+", question.lower())
-    return sorted(set(tokens))
+def _extract_terms(lower_question: str) -> List[str]:
+    return sorted(set(_TERM_RE.findall(lower_question)))
 
 
 def _detect_focuses(lower_question: str) -> List[str]:
@@ -73,9 +73,10 @@ def _detect_timeframe(lower_question: str) -> str:
 
 
 def _detect_sentiment(terms: Sequence[str]) -> str:
-    if any(term in _NEGATIVE_KEYWORDS for term in terms):
+    # isdisjoint walks the terms in C instead of a Python-level any() loop.
+    if not _NEGATIVE_KEYWORDS.isdisjoint(terms):
         return "concerned"
-    if any(term in _POSITIVE_KEYWORDS for term in terms):
+    if not _POSITIVE_KEYWORDS.isdisjoint(terms):
         return "hopeful"
     return "curious"
 
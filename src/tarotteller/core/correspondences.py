@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Mapping, Sequence, Tuple
+from typing import Dict, Mapping, Optional, Sequence, Tuple
 
-from .deck import DrawnCard, TarotCard
+from .deck import _DATACLASS_SLOTS, DrawnCard, TarotCard
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class NumerologyMeaning:
     number: int
     title: str
@@ -71,6 +71,15 @@ _CHALDEAN_NUMEROLOGY: Mapping[int, NumerologyMeaning] = {
 }
 
 
+# Reduced numbers only span 0-9, so each report line is formatted up front.
+_NUMEROLOGY_LINES: Mapping[int, str] = {
+    number: (
+        f"Chaldean Numerology : {meaning.number} — {meaning.title}. {meaning.summary}"
+    )
+    for number, meaning in _CHALDEAN_NUMEROLOGY.items()
+}
+
+
 _MAJOR_ARCANA_ASTROLOGY: Mapping[str, str] = {
     "The Fool": "Uranus & Air — leaps of faith, open horizons, originality.",
     "The Magician": "Mercury — intellect, communication, skilful manifestation.",
@@ -120,6 +129,12 @@ _CHINESE_ZODIAC: Sequence[Tuple[str, str]] = (
     ("Pig", "Generous host reminding you to savour comfort and shared joy."),
 )
 
+# The zodiac repeats every twelve card numbers, so its report line is
+# formatted once per animal rather than on every correspondence lookup.
+_CHINESE_ZODIAC_LINES: Tuple[str, ...] = tuple(
+    f"Chinese Zodiac Echo  : {name} — {summary}" for name, summary in _CHINESE_ZODIAC
+)
+
 
 _NATIVE_ELEMENT_ANIMALS: Mapping[str, Tuple[str, str]] = {
     "fire": ("Red-tailed Hawk", "See the long view, trust fierce focus, and answer the call to act."),
@@ -130,13 +145,15 @@ _NATIVE_ELEMENT_ANIMALS: Mapping[str, Tuple[str, str]] = {
 }
 
 
+_DESCRIPTION_CACHE: Dict[Tuple[str, int, Optional[str], Optional[str], bool], str] = {}
+
+
 def _reduce_to_chaldean(number: int) -> int:
     if number <= 0:
         return 0
-    total = number
-    while total > 9:
-        total = sum(int(digit) for digit in str(total))
-    return total if total in _CHALDEAN_NUMEROLOGY else 0
+    # Repeated digit sums converge on the digital root, which has a closed
+    # form; this avoids stringifying the number on every lookup.
+    return 1 + (number - 1) % 9
 
 
 def numerology_for(card: TarotCard) -> NumerologyMeaning:
@@ -145,11 +162,12 @@ def numerology_for(card: TarotCard) -> NumerologyMeaning:
 
 
 def astrology_for(card: TarotCard) -> str:
-    if card.name in _MAJOR_ARCANA_ASTROLOGY:
-        return _MAJOR_ARCANA_ASTROLOGY[card.name]
-    if card.suit and card.suit in _SUIT_ASTROLOGY:
-        return _SUIT_ASTROLOGY[card.suit]
-    return "Celestial rhythm — tune into the sky's subtle timing cues."
+    astrology = _MAJOR_ARCANA_ASTROLOGY.get(card.name)
+    if astrology is None and card.suit:
+        astrology = _SUIT_ASTROLOGY.get(card.suit)
+    if astrology is None:
+        return "Celestial rhythm — tune into the sky's subtle timing cues."
+    return astrology
 
 
 def chinese_zodiac_for(card: TarotCard) -> Tuple[str, str]:
@@ -158,20 +176,30 @@ def chinese_zodiac_for(card: TarotCard) -> Tuple[str, str]:
 
 
 def native_medicine_for(card: TarotCard) -> Tuple[str, str]:
-    element = (card.element or "").lower()
-    if element in _NATIVE_ELEMENT_ANIMALS:
-        return _NATIVE_ELEMENT_ANIMALS[element]
-    if card.suit and card.suit.lower() in _NATIVE_ELEMENT_ANIMALS:
-        return _NATIVE_ELEMENT_ANIMALS[card.suit.lower()]
-    return _NATIVE_ELEMENT_ANIMALS["spirit"]
+    medicine = _NATIVE_ELEMENT_ANIMALS.get((card.element or "").lower())
+    if medicine is None and card.suit:
+        medicine = _NATIVE_ELEMENT_ANIMALS.get(card.suit.lower())
+    if medicine is None:
+        return _NATIVE_ELEMENT_ANIMALS["spirit"]
+    return medicine
 
 
 def describe_card_correspondences(drawn_card: DrawnCard) -> str:
     """Return a formatted block describing layered esoteric correspondences."""
 
-    numerology = numerology_for(drawn_card.card)
+    card = drawn_card.card
+    # The block only depends on these fields, so the CLI, GUI and repeat draws
+    # share one rendering per card and orientation.
+    key = (card.name, card.number, card.suit, card.element, drawn_card.is_reversed)
+    description = _DESCRIPTION_CACHE.get(key)
+    if description is None:
+        description = _describe_card_correspondences(drawn_card)
+        _DESCRIPTION_CACHE[key] = description
+    return description
+
+
+def _describe_card_correspondences(drawn_card: DrawnCard) -> str:
     astrology = astrology_for(drawn_card.card)
-    zodiac_name, zodiac_summary = chinese_zodiac_for(drawn_card.card)
     medicine_animal, medicine_summary = native_medicine_for(drawn_card.card)
 
     orientation_note = (
@@ -181,9 +209,9 @@ def describe_card_correspondences(drawn_card: DrawnCard) -> str:
     )
 
     lines = [
-        f"Chaldean Numerology : {numerology.number} — {numerology.title}. {numerology.summary}",
+        _NUMEROLOGY_LINES[_reduce_to_chaldean(drawn_card.card.number)],
         f"Astrological Link    : {astrology}",
-        f"Chinese Zodiac Echo  : {zodiac_name} — {zodiac_summary}",
+        _CHINESE_ZODIAC_LINES[drawn_card.card.number % len(_CHINESE_ZODIAC_LINES)],
         f"Native Medicine Ally : {medicine_animal} — {medicine_summary}",
         f"Orientation Lens     : {orientation_note} guides how you integrate this card's lesson.",
     ]
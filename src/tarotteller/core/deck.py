@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import random
+import sys
 from dataclasses import dataclass
 import textwrap
-from typing import Iterable, Iterator, List, Optional, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
 
 from . import data
 
 
+# ``slots=True`` needs Python 3.10+; older interpreters fall back to __dict__.
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 _MEANING_WRAP_WIDTH = 72
 
 
@@ -25,13 +28,35 @@ def _natural_join(words: Sequence[str]) -> str:
     return f"{', '.join(words[:-1])}, and {words[-1]}"
 
 
+def _normalize_name(name: str) -> str:
+    """Lower-case ``name`` and collapse its whitespace for comparisons."""
+
+    return " ".join(name.lower().split())
+
+
 def _wrap_paragraph(text: str) -> str:
     """Wrap ``text`` to the standard meaning width."""
 
     return textwrap.fill(" ".join(text.split()), width=_MEANING_WRAP_WIDTH)
 
 
-@dataclass(frozen=True)
+_PROMPT_INDENT = "   "
+_PROMPT_WRAPPER = textwrap.TextWrapper(
+    width=_MEANING_WRAP_WIDTH,
+    initial_indent=_PROMPT_INDENT,
+    subsequent_indent=_PROMPT_INDENT,
+)
+
+
+def _indent(text: str, prefix: str) -> str:
+    """Prefix the non-blank lines of ``text`` the way :func:`textwrap.indent` does."""
+
+    return "\n".join(
+        [prefix + line if line.strip() else line for line in text.split("\n")]
+    )
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class TarotCard:
     """Represents a single tarot card with upright and reversed meanings."""
 
@@ -67,11 +92,10 @@ class TarotCard:
         The comparison is case-insensitive and ignores superfluous whitespace.
         """
 
-        normalized = " ".join(query.strip().lower().split())
-        return normalized == " ".join(self.name.lower().split())
+        return _normalize_name(query) == _normalize_name(self.name)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class DrawnCard:
     """A tarot card that has been drawn and oriented."""
 
@@ -122,6 +146,10 @@ class TarotDeck:
         self._cards: List[TarotCard] = [
             TarotCard.from_dict(entry) for entry in data.iter_all_cards()
         ]
+        # Normalised names are indexed once so lookups skip a scan of the deck.
+        self._cards_by_name: Dict[str, TarotCard] = {}
+        for card in self._cards:
+            self._cards_by_name.setdefault(_normalize_name(card.name), card)
         self._stack: List[TarotCard] = []
         self.reset(shuffle=True)
 
@@ -175,9 +203,12 @@ class TarotDeck:
             raise ValueError("Not enough cards remaining in the deck")
 
         orientation_rng = rng or self._rng
+        # Take the top of the stack in one slice; repeated pop(0) calls would
+        # shift the remaining cards once per draw.
+        cards = self._stack[:count]
+        del self._stack[:count]
         drawn_cards: List[DrawnCard] = []
-        for _ in range(count):
-            card = self._stack.pop(0)
+        for card in cards:
             is_reversed = allow_reversed and bool(orientation_rng.getrandbits(1))
             drawn_cards.append(DrawnCard(card=card, is_reversed=is_reversed))
         return drawn_cards
@@ -185,10 +216,7 @@ class TarotDeck:
     def get_card(self, query: str) -> Optional[TarotCard]:
         """Look up a card by name, returning ``None`` if it is not found."""
 
-        for card in self._cards:
-            if card.matches(query):
-                return card
-        return None
+        return self._cards_by_name.get(_normalize_name(query))
 
     def list_cards(
         self,
@@ -2,37 +2,90 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Mapping, Sequence
+import heapq
+import weakref
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Sequence, Tuple
 
 from .ai_engine import AIEngine
 from .context import ContextProfile
+from .deck import _DATACLASS_SLOTS, DrawnCard, TarotCard
 from .knowledge import TarotKnowledgeBase
 from .spreads import SpreadPlacement, SpreadReading
 
+_SENTENCE_ENDINGS = ".!?"
 
-def build_prompt_interpretation(
-    placement: SpreadPlacement, knowledge_base: TarotKnowledgeBase
-) -> str:
-    """Return a narrative interpretation that pairs a prompt with card insight."""
 
-    drawn_card = placement.card
+_PROMPT_CACHE_SIZE = 2048
+# Rendered prompt interpretations, one table per knowledge base; weak keys let
+# each table go away together with the knowledge base it was built from.
+_PROMPT_CACHES: weakref.WeakKeyDictionary[
+    TarotKnowledgeBase, Dict[Tuple[DrawnCard, str, str], str]
+] = weakref.WeakKeyDictionary()
+
+
+def _prompt_interpretation(
+    knowledge_base: TarotKnowledgeBase, drawn_card: DrawnCard, title: str, prompt: str
+) -> str:
     themes = knowledge_base.themes_for_card(drawn_card.card)
     focus = themes[0] if themes else "spirituality"
     message = knowledge_base.insight_for(drawn_card, focus)
 
-    prompt = placement.position.prompt.strip()
-    if prompt and not prompt.endswith((".", "!", "?")):
-        prompt += "."
-    prompt = f"{prompt} " if prompt else ""
+    prompt = prompt.strip()
+    if prompt:
+        if prompt[-1] not in _SENTENCE_ENDINGS:
+            prompt += "."
+        prompt += " "
 
     return (
-        f"In the {placement.position.title} position, "
+        f"In the {title} position, "
         f"{prompt}{message}"
     )
 
 
-@dataclass
+def build_prompt_interpretation(
+    placement: SpreadPlacement, knowledge_base: TarotKnowledgeBase
+) -> str:
+    """Return a narrative interpretation that pairs a prompt with card insight."""
+
+    position = placement.position
+    key = (placement.card, position.title, position.prompt)
+    try:
+        hash(key)
+    except TypeError:
+        # Cards built from list metadata are unhashable; render them uncached.
+        return _prompt_interpretation(knowledge_base, *key)
+
+    cache = _PROMPT_CACHES.setdefault(knowledge_base, {})
+    text = cache.get(key)
+    if text is None:
+        text = _prompt_interpretation(knowledge_base, *key)
+        if len(cache) < _PROMPT_CACHE_SIZE:
+            cache[key] = text
+    return text
+
+
+@lru_cache(maxsize=1024)
+def _select_focus(card_themes: Tuple[str, ...], focuses: Tuple[str, ...]) -> str:
+    theme_set = frozenset(card_themes)
+    matched = next((focus for focus in focuses if focus in theme_set), None)
+    if matched is not None:
+        return matched
+    if card_themes:
+        return card_themes[0]
+    return focuses[0] if focuses else "general"
+
+
+class _ProfileView(NamedTuple):
+    """Display strings derived from a :class:`ContextProfile`."""
+
+    timeframe: str
+    focus_text: str
+    signals: str
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class PersonalizedInsight:
     """A contextual message generated for a drawn card."""
 
@@ -42,9 +95,16 @@ class PersonalizedInsight:
     orientation: str
     prompt: str
     message: str
+    # Lower-cased forms used by the narrative renderers, derived once here.
+    orientation_lower: str = field(init=False, repr=False, compare=False)
+    prompt_phrase: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.orientation_lower = self.orientation.lower()
+        self.prompt_phrase = self.prompt.rstrip(".").lower()
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AIReading:
     """Structured result returned from an AI-assisted interpretation."""
 
@@ -55,43 +115,102 @@ class AIReading:
     response_id: str | None = None
     metadata: Dict[str, Any] | None = None
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, *, deep: bool = False) -> Dict[str, Any]:
+        """Serialise the reading.
+
+        Insight and metadata dictionaries are shared with this instance unless
+        ``deep`` is true, in which case callers receive private copies they may
+        mutate freely.
+        """
+
         payload: Dict[str, Any] = {
             "summary": self.summary,
             "tone": self.tone,
-            "card_insights": [dict(insight) for insight in self.card_insights],
+            "card_insights": (
+                [dict(insight) for insight in self.card_insights]
+                if deep
+                else list(self.card_insights)
+            ),
             "model": self.model,
         }
         if self.response_id is not None:
             payload["response_id"] = self.response_id
         if self.metadata is not None:
-            payload["metadata"] = dict(self.metadata)
+            payload["metadata"] = dict(self.metadata) if deep else self.metadata
         return payload
 
 
 class InterpretationEngine:
     """Produce contextual readings that blend spreads with question intent."""
 
+    _AI_READING_TEMPLATE = (
+        "AI-Assisted Reading\n"
+        "-------------------\n"
+        "{profile_block}"
+        "Tone     : {tone}\n"
+        "Model    : {model}\n"
+        "{response_block}"
+        "\n"
+        "{summary}\n"
+        "\n"
+        "{cards}"
+    )
+    _SUMMARY_TEMPLATE = (
+        "{header}\n"
+        "\n"
+        "{cards}"
+        "Story Arc\n"
+        "---------\n"
+        "{story}"
+        "Let these highlights guide follow-up actions and keep logging feedback to "
+        "train the model on what resonates."
+    )
+
     def __init__(self, knowledge_base: TarotKnowledgeBase):
         self._knowledge_base = knowledge_base
+        self._themes_for_card = knowledge_base.themes_for_card
+        self._kb_insight_for = knowledge_base.insight_for
         self._ai_engine: AIEngine | None = None
         self._last_ai_result: AIReading | None = None
+        self._insight_cache: Dict[Tuple[str, bool, str], str] = {}
+        self._profile_view_cache: Tuple[ContextProfile, _ProfileView] | None = None
 
     def _format_focuses(self, focuses: Sequence[str]) -> str:
-        if not focuses:
+        count = len(focuses)
+        if count == 0:
             return "your evolving path"
-        if len(focuses) == 1:
+        if count == 1:
             return focuses[0].replace("_", " ")
-        *rest, last = [focus.replace("_", " ") for focus in focuses]
-        return ", ".join(rest) + f" and {last}"
+        if count == 2:
+            return f"{focuses[0].replace('_', ' ')} and {focuses[1].replace('_', ' ')}"
+        parts = [focus.replace("_", " ") for focus in focuses]
+        return f"{', '.join(parts[:-1])} and {parts[-1]}"
+
+    def _profile_view(self, profile: ContextProfile) -> _ProfileView:
+        # Renderers for one reading share a profile, so remembering the most
+        # recent one is enough to compute these strings once per reading.
+        cached = self._profile_view_cache
+        if cached is not None and cached[0] is profile:
+            return cached[1]
+        view = _ProfileView(
+            timeframe=profile.timeframe.replace("_", " "),
+            focus_text=self._format_focuses(profile.focuses),
+            signals=", ".join(heapq.nsmallest(6, profile.highlighted_terms)),
+        )
+        self._profile_view_cache = (profile, view)
+        return view
 
-    def _select_focus(self, card_themes: Sequence[str], focuses: Sequence[str]) -> str:
-        for focus in focuses:
-            if focus in card_themes:
-                return focus
-        if card_themes:
-            return card_themes[0]
-        return focuses[0] if focuses else "general"
+    def _themes_for(self, card: TarotCard) -> Tuple[str, ...]:
+        # The knowledge base already memoises theme scores per card.
+        return tuple(self._themes_for_card(card))
+
+    def _insight_for(self, drawn_card: DrawnCard, focus: str) -> str:
+        key = (drawn_card.card.name, drawn_card.is_reversed, focus)
+        message = self._insight_cache.get(key)
+        if message is None:
+            message = self._kb_insight_for(drawn_card, focus)
+            self._insight_cache[key] = message
+        return message
 
     def _build_insight(
         self,
@@ -99,16 +218,16 @@ class InterpretationEngine:
         profile: ContextProfile,
     ) -> PersonalizedInsight:
         card = placement.card
-        themes = self._knowledge_base.themes_for_card(card.card)
-        focus = self._select_focus(themes, profile.focuses)
-        message = self._knowledge_base.insight_for(card, focus)
+        tarot_card = card.card
+        position = placement.position
+        focus = _select_focus(self._themes_for(tarot_card), tuple(profile.focuses))
         return PersonalizedInsight(
-            placement_index=placement.position.index,
-            title=placement.position.title,
-            card_name=card.card.name,
+            placement_index=position.index,
+            title=position.title,
+            card_name=tarot_card.name,
             orientation=card.orientation,
-            prompt=placement.position.prompt,
-            message=message,
+            prompt=position.prompt,
+            message=self._insight_for(card, focus),
         )
 
     def configure_ai_engine(self, ai_engine: AIEngine | None) -> None:
@@ -163,42 +282,46 @@ class InterpretationEngine:
                 reading, profile, ai_engine=ai_engine, question=question
             )
             return ai_reading.card_insights
-        return [self._build_insight(placement, profile) for placement in reading.placements]
+        build = self._build_insight
+        return [build(placement, profile) for placement in reading.placements]
 
     def render_ai_reading(
         self, ai_reading: AIReading, profile: ContextProfile | None = None
     ) -> str:
         """Render a textual block summarising an AI-assisted reading."""
 
-        lines: List[str] = []
-        lines.append("AI-Assisted Reading")
-        lines.append("-------------------")
+        profile_block = ""
         if profile:
-            lines.append(f"Question : {profile.question}")
-            if profile.focuses:
-                lines.append(f"Focus    : {', '.join(profile.focuses)}")
-            lines.append(f"Timeframe: {profile.timeframe.replace('_', ' ')}")
-            lines.append(f"Mood     : {profile.sentiment}")
-            lines.append("")
-        lines.append(f"Tone     : {ai_reading.tone}")
-        lines.append(f"Model    : {ai_reading.model}")
-        if ai_reading.response_id:
-            lines.append(f"Response : {ai_reading.response_id}")
-        lines.append("")
-        lines.append(ai_reading.summary.strip())
-        lines.append("")
-        for index, insight in enumerate(ai_reading.card_insights, start=1):
-            card = insight.get("card", "Unknown Card")
-            position = insight.get("position", f"Card {index}")
-            orientation = insight.get("orientation", "upright")
-            message = insight.get("message", "")
-            lines.append(f"{index}. {position} — {card} ({orientation})")
-            lines.append("   " + message)
-            focus = insight.get("focus")
-            if focus:
-                lines.append(f"   Focus: {focus}")
-            lines.append("")
-        return "\n".join(lines).strip()
+            focus_line = (
+                f"Focus    : {', '.join(profile.focuses)}\n" if profile.focuses else ""
+            )
+            profile_block = (
+                f"Question : {profile.question}\n"
+                f"{focus_line}"
+                f"Timeframe: {self._profile_view(profile).timeframe}\n"
+                f"Mood     : {profile.sentiment}\n"
+                "\n"
+            )
+        response_block = (
+            f"Response : {ai_reading.response_id}\n" if ai_reading.response_id else ""
+        )
+        cards = "".join(
+            f"{index}. {insight.get('position', f'Card {index}')} — "
+            f"{insight.get('card', 'Unknown Card')} "
+            f"({insight.get('orientation', 'upright')})\n"
+            f"   {insight.get('message', '')}\n"
+            + (f"   Focus: {insight['focus']}\n" if insight.get("focus") else "")
+            + "\n"
+            for index, insight in enumerate(ai_reading.card_insights, start=1)
+        )
+        return self._AI_READING_TEMPLATE.format(
+            profile_block=profile_block,
+            tone=ai_reading.tone,
+            model=ai_reading.model,
+            response_block=response_block,
+            summary=ai_reading.summary.strip(),
+            cards=cards,
+        ).strip()
 
     @property
     def last_ai_reading(self) -> AIReading | None:
@@ -208,10 +331,11 @@ class InterpretationEngine:
         self, insights: Sequence[PersonalizedInsight], profile: ContextProfile
     ) -> List[str]:
         story_lines: List[str] = []
-        focus_text = self._format_focuses(profile.focuses)
-        timeframe = profile.timeframe.replace("_", " ")
+        view = self._profile_view(profile)
+        focus_text = view.focus_text
+        timeframe = view.timeframe
         mood = profile.sentiment
-        highlighted = ", ".join(sorted(profile.highlighted_terms)[:6])
+        highlighted = view.signals
 
         opener = (
             f"You arrive with a {mood} heart, asking '{profile.question}'. "
@@ -222,11 +346,9 @@ class InterpretationEngine:
         story_lines.append(opener)
 
         for insight in insights:
-            orientation = insight.orientation.lower()
-            prompt = insight.prompt.rstrip(".")
             chapter = (
-                f"In the chapter of {insight.title}, the {insight.card_name} appears {orientation}. "
-                f"It responds to the call to {prompt.lower()} and whispers: {insight.message}"
+                f"In the chapter of {insight.title}, the {insight.card_name} appears {insight.orientation_lower}. "
+                f"It responds to the call to {insight.prompt_phrase} and whispers: {insight.message}"
             )
             story_lines.append(chapter)
 
@@ -237,6 +359,19 @@ class InterpretationEngine:
         story_lines.append(closer)
         return story_lines
 
+    def _render_header(self, profile: ContextProfile, *, include_signals: bool) -> List[str]:
+        question = profile.question
+        focuses = profile.focuses
+        view = self._profile_view(profile)
+        lines = ["Personalized Insight", "-------------------", f"Question : {question}"]
+        if focuses:
+            lines.append(f"Focus    : {', '.join(focuses)}")
+        lines.append(f"Timeframe: {view.timeframe}")
+        lines.append(f"Mood     : {profile.sentiment}")
+        if include_signals and profile.highlighted_terms:
+            lines.append(f"Signals  : {view.signals}")
+        return lines
+
     def render_personalised_summary(
         self,
         reading: SpreadReading,
@@ -247,66 +382,46 @@ class InterpretationEngine:
 
         if insights is None:
             insights = self.insights_for_reading(reading, profile)
-        lines: List[str] = []
-        lines.append("Personalized Insight")
-        lines.append("-------------------")
-        lines.append(f"Question : {profile.question}")
-        if profile.focuses:
-            lines.append(f"Focus    : {', '.join(profile.focuses)}")
-        lines.append(f"Timeframe: {profile.timeframe.replace('_', ' ')}")
-        lines.append(f"Mood     : {profile.sentiment}")
-        if profile.highlighted_terms:
-            lines.append(
-                "Signals  : " + ", ".join(sorted(profile.highlighted_terms)[:6])
-            )
-        lines.append("")
-        for insight in insights:
-            header = (
+        header = self._render_header(profile, include_signals=True)
+        # List comprehensions let str.join size the result in one pass.
+        cards = "".join(
+            [
                 f"{insight.placement_index}. {insight.title} — "
-                f"{insight.card_name} ({insight.orientation})"
-            )
-            lines.append(header)
-            lines.append("   " + insight.prompt)
-            lines.append("   " + insight.message)
-            lines.append("")
-        lines.append("Story Arc")
-        lines.append("---------")
-        for paragraph in self._compose_story_arc(insights, profile):
-            lines.append(paragraph)
-            lines.append("")
-        lines.append(
-            "Let these highlights guide follow-up actions and keep logging feedback to "
-            "train the model on what resonates."
+                f"{insight.card_name} ({insight.orientation})\n"
+                f"   {insight.prompt}\n"
+                f"   {insight.message}\n"
+                "\n"
+                for insight in insights
+            ]
         )
-        return "\n".join(lines).strip()
+        story = "".join(
+            [f"{paragraph}\n\n" for paragraph in self._compose_story_arc(insights, profile)]
+        )
+        return self._SUMMARY_TEMPLATE.format(
+            header="\n".join(header), cards=cards, story=story
+        ).strip()
 
     def render_for_cards(
         self, cards: Iterable[PersonalizedInsight], profile: ContextProfile
     ) -> str:
-        lines: List[str] = []
-        lines.append("Personalized Insight")
-        lines.append("-------------------")
-        lines.append(f"Question : {profile.question}")
-        if profile.focuses:
-            lines.append(f"Focus    : {', '.join(profile.focuses)}")
-        lines.append(f"Timeframe: {profile.timeframe.replace('_', ' ')}")
-        lines.append(f"Mood     : {profile.sentiment}")
-        lines.append("")
-        for insight in cards:
-            header = f"{insight.card_name} ({insight.orientation})"
-            lines.append(header)
-            lines.append("   " + insight.message)
-            lines.append("")
+        lines = self._render_header(profile, include_signals=False)
+        lines[-1] += "\n"
+        lines.extend(
+            [
+                f"{insight.card_name} ({insight.orientation})\n   {insight.message}\n"
+                for insight in cards
+            ]
+        )
         return "\n".join(lines).strip()
 
     def build_card_insight(self, drawn_card, profile: ContextProfile) -> PersonalizedInsight:
-        themes = self._knowledge_base.themes_for_card(drawn_card.card)
-        focus = self._select_focus(themes, profile.focuses)
-        message = self._knowledge_base.insight_for(drawn_card, focus)
+        tarot_card = drawn_card.card
+        focus = _select_focus(self._themes_for(tarot_card), tuple(profile.focuses))
+        message = self._insight_for(drawn_card, focus)
         return PersonalizedInsight(
             placement_index=0,
             title="",  # Not used for direct draws
-            card_name=drawn_card.card.name,
+            card_name=tarot_card.name,
             orientation=drawn_card.orientation,
             prompt="",
             message=message,
@@ -324,21 +439,22 @@ class InterpretationEngine:
         if not insights:
             return ""
 
-        primary = min(
-            insights,
-            key=lambda insight: (
-                insight.placement_index if insight.placement_index else 0,
-                insight.card_name,
-            ),
-        )
-        focus_text = self._format_focuses(profile.focuses)
-        timeframe_text = profile.timeframe.replace("_", " ")
-
-        response_lines: List[str] = []
-        response_lines.append("Question Response")
-        response_lines.append("-----------------")
-        response_lines.append(f"You asked: {profile.question}")
-        response_lines.append("")
+        primary = insights[0]
+        best_key = (primary.placement_index or 0, primary.card_name)
+        for insight in insights:
+            key = (insight.placement_index or 0, insight.card_name)
+            if key < best_key:
+                best_key = key
+                primary = insight
+        view = self._profile_view(profile)
+        focus_text = view.focus_text
+        timeframe_text = view.timeframe
+
+        response_lines: List[str] = [
+            "Question Response",
+            "-----------------",
+            f"You asked: {profile.question}\n",
+        ]
 
         if spread_title:
             context_line = f"Drawing on the {spread_title} spread, "
@@ -349,10 +465,10 @@ class InterpretationEngine:
         if primary.title:
             descriptor.append(f"the {primary.title} position")
         if primary.prompt:
-            descriptor.append(primary.prompt.lower().rstrip("."))
+            descriptor.append(primary.prompt_phrase)
         descriptor_text = " about ".join(descriptor) if descriptor else "the message"
 
-        orientation = primary.orientation.lower()
+        orientation = primary.orientation_lower
         card_name = primary.card_name
 
         message_sentence = (
@@ -360,7 +476,7 @@ class InterpretationEngine:
         )
 
         if primary.prompt:
-            prompt_text = primary.prompt.rstrip(".").lower()
+            prompt_text = primary.prompt_phrase
             follow_intro = f"It speaks to {prompt_text}. "
         else:
             follow_intro = ""
@@ -6,7 +6,7 @@ from collections import Counter
 from dataclasses import dataclass
 from typing import Iterable, List, Mapping, Sequence
 
-from .deck import DrawnCard, TarotCard
+from .deck import DrawnCard, TarotCard, _natural_join
 
 # Keyword lexicon connecting high level themes to vocabulary that commonly
 # appears in tarot interpretations.  The lexicon intentionally overlaps with the
@@ -87,16 +87,14 @@ THEME_KEYWORDS: Mapping[str, Sequence[str]] = {
 }
 
 
-def _natural_join(words: Sequence[str]) -> str:
-    """Return a human friendly comma separated list."""
-
-    if not words:
-        return ""
-    if len(words) == 1:
-        return words[0]
-    if len(words) == 2:
-        return f"{words[0]} and {words[1]}"
-    return f"{', '.join(words[:-1])}, and {words[-1]}"
+# Lower-cased views of the lexicon, built once for the matching loops below.
+_LOWERED_THEME_KEYWORDS: Mapping[str, tuple[str, ...]] = {
+    theme: tuple(token.lower() for token in lexicon)
+    for theme, lexicon in THEME_KEYWORDS.items()
+}
+_THEME_KEYWORD_SETS: Mapping[str, frozenset[str]] = {
+    theme: frozenset(lexicon) for theme, lexicon in _LOWERED_THEME_KEYWORDS.items()
+}
 
 
 @dataclass(frozen=True)
@@ -133,8 +131,7 @@ class TarotKnowledgeBase:
 
         snippets = self._text_snippets(card)
         scores: Counter[str] = Counter()
-        for theme, lexicon in THEME_KEYWORDS.items():
-            lowered = [token.lower() for token in lexicon]
+        for theme, lowered in _LOWERED_THEME_KEYWORDS.items():
             for snippet in snippets:
                 if any(word in snippet for word in lowered):
                     scores[theme] += 1
@@ -159,7 +156,7 @@ class TarotKnowledgeBase:
     def insight_for(self, drawn_card: DrawnCard, focus: str) -> str:
         """Generate a short recommendation for ``drawn_card`` within ``focus``."""
 
-        theme_keywords = set(word.lower() for word in THEME_KEYWORDS.get(focus, ()))
+        theme_keywords = _THEME_KEYWORD_SETS.get(focus, frozenset())
         overlap = [
             keyword
             for keyword in drawn_card.keywords
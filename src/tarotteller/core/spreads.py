@@ -7,10 +7,13 @@ from dataclasses import dataclass
 import textwrap
 from typing import Any, Dict, List, Optional
 
-from .deck import DrawnCard, TarotDeck
+from .deck import _DATACLASS_SLOTS, DrawnCard, TarotDeck, _indent
 
 
-@dataclass(frozen=True)
+_MEANING_INDENT = "  "
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SpreadPosition:
     """Metadata describing a slot within a tarot spread."""
 
@@ -19,7 +22,7 @@ class SpreadPosition:
     prompt: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Spread:
     """A tarot spread describing how many cards to draw and their roles."""
 
@@ -32,7 +35,7 @@ class Spread:
         return len(self.positions)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SpreadPlacement:
     """A drawn card paired with its position in the spread."""
 
@@ -40,7 +43,7 @@ class SpreadPlacement:
     card: DrawnCard
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SpreadReading:
     """The final result of evaluating a spread with a deck."""
 
@@ -89,7 +92,7 @@ class SpreadReading:
                 f"Card: {placement.card.card.name} ({placement.card.orientation})",
                 width=72,
             )
-            meaning = textwrap.indent(placement.card.meaning, "  ")
+            meaning = _indent(placement.card.meaning, _MEANING_INDENT)
             lines.append(prompt)
             lines.append(card_line)
             lines.append(meaning)
@@ -1,5 +1,17 @@
 from .cli import build_parser, main
-from .gui import HELP_TEXT, TarotTellerApp, launch
+
+# The GUI pulls in tkinter and importlib.metadata, which the command line never
+# needs, so its exports are resolved on first access.
+_GUI_EXPORTS = frozenset({"HELP_TEXT", "TarotTellerApp", "launch"})
+
+
+def __getattr__(name: str):
+    if name in _GUI_EXPORTS:
+        from . import gui
+
+        return getattr(gui, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "build_parser",
@@ -4,13 +4,20 @@ from __future__ import annotations
 
 import argparse
 import sys
-import textwrap
+from functools import lru_cache
 from typing import Iterable, List, Optional
 
 from ..core.ai_engine import AIEngine
 from ..core.context import analyze_question
 from ..core.correspondences import describe_card_correspondences
-from ..core.deck import TarotCard, TarotDeck, format_card
+from ..core.deck import (
+    _PROMPT_INDENT,
+    _PROMPT_WRAPPER,
+    TarotCard,
+    TarotDeck,
+    _indent,
+    format_card,
+)
 from ..core.engine import InterpretationEngine
 from ..core.knowledge import TarotKnowledgeBase
 from ..core.spreads import SPREADS, SpreadReading, draw_spread
@@ -24,10 +31,7 @@ def _print_cards(cards: Iterable[TarotCard]) -> None:
 
 
 def _wrap_prompt(text: str) -> str:
-    wrapper = textwrap.TextWrapper(
-        width=72, initial_indent="   ", subsequent_indent="   "
-    )
-    return wrapper.fill(text)
+    return _PROMPT_WRAPPER.fill(text)
 
 
 def cmd_list(deck: TarotDeck, args: argparse.Namespace) -> int:
@@ -58,10 +62,8 @@ def _format_simple_draw(reading: SpreadReading) -> str:
     for placement in reading.placements:
         card = placement.card
         prompt = _wrap_prompt(placement.position.prompt)
-        meaning = textwrap.indent(card.meaning, "   ")
-        correspondences = textwrap.indent(
-            describe_card_correspondences(card), "   "
-        )
+        meaning = _indent(card.meaning, _PROMPT_INDENT)
+        correspondences = _indent(describe_card_correspondences(card), _PROMPT_INDENT)
         sections = [prompt, meaning, correspondences]
         formatted = "\n\n".join(section for section in sections if section)
         lines.append(
@@ -104,9 +106,9 @@ def cmd_draw(deck: TarotDeck, args: argparse.Namespace) -> int:
             return 1
         lines = []
         for index, card in enumerate(drawn, start=1):
-            meaning = textwrap.indent(card.meaning, "   ")
-            correspondences = textwrap.indent(
-                describe_card_correspondences(card), "   "
+            meaning = _indent(card.meaning, _PROMPT_INDENT)
+            correspondences = _indent(
+                describe_card_correspondences(card), _PROMPT_INDENT
             )
             block = "\n\n".join(
                 segment for segment in (meaning, correspondences) if segment
@@ -253,9 +255,18 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@lru_cache(maxsize=1)
+def _shared_parser() -> argparse.ArgumentParser:
+    """Return the parser :func:`main` reuses across repeated invocations."""
+
+    # parse_args leaves the parser untouched, so scripted or test callers that
+    # invoke main() many times only pay for argparse setup once.
+    return build_parser()
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     deck = TarotDeck()
-    parser = build_parser()
+    parser = _shared_parser()
     args = parser.parse_args(argv)
     return args.func(deck, args)
 
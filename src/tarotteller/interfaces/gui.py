@@ -1,29 +1,152 @@
 from __future__ import annotations
 
 import math
-import textwrap
 import tkinter as tk
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from datetime import datetime
 from tkinter import filedialog, messagebox, ttk
-from typing import Iterable, List, Optional
+from typing import Callable, Dict, Iterable, Optional, Tuple
 
 from importlib.metadata import PackageNotFoundError, version
 
 from ..core.card_images import resolve_card_image
-from ..core.context import analyze_question
+from ..core.context import ContextProfile, analyze_question
 from ..core.correspondences import describe_card_correspondences
-from ..core.deck import DrawnCard, TarotDeck
-from ..core.engine import InterpretationEngine, build_prompt_interpretation
+from ..core.deck import (
+    _PROMPT_INDENT,
+    _PROMPT_WRAPPER,
+    DrawnCard,
+    TarotCard,
+    TarotDeck,
+    _indent,
+)
+from ..core.engine import InterpretationEngine
 from ..core.knowledge import TarotKnowledgeBase
 from ..core.spreads import SPREADS, SpreadReading, draw_spread
 from ..narrative.immersive import build_immersive_companion
 
 
-_TEXT_WRAP_WIDTH = 72
 _PREVIEW_MAX_WIDTH = 220
 _PREVIEW_MAX_HEIGHT = 320
+_DRAW_POLL_MS = 30
+_KEY_DEBOUNCE_MS = 150
+_READING_CACHE_SIZE = 8
+# Tk roots whose ttk styles are already configured; weak so closed roots drop out.
+_STYLED_ROOTS: weakref.WeakSet[tk.Tk] = weakref.WeakSet()
+_SPREAD_CHOICES = tuple(sorted(SPREADS))
+_TONE_CHOICES = ("radiant", "mystic", "grounded")
+_FONT_BASE = ("Segoe UI", 10)
+_FONT_BOLD = ("Segoe UI", 10, "bold")
+_STYLE_SPECS: Tuple[Tuple[str, Dict[str, object]], ...] = (
+    ("TFrame", {"background": "#f6f4fb"}),
+    ("TLabel", {"background": "#f6f4fb", "foreground": "#2e1f4f"}),
+    ("TSeparator", {"background": "#e4ddf3"}),
+    ("App.TFrame", {"background": "#f6f4fb"}),
+    ("Brand.TLabel", {"font": ("Segoe UI", 22, "bold"), "foreground": "#2e1f4f"}),
+    ("SubBrand.TLabel", {"font": ("Segoe UI", 11), "foreground": "#5b4b8a"}),
+    (
+        "Hint.TLabel",
+        {"foreground": "#4b3c70", "background": "#f6f4fb", "wraplength": 520},
+    ),
+    ("Card.TFrame", {"background": "#ffffff"}),
+    ("Card.TLabel", {"background": "#ffffff", "foreground": "#2e1f4f"}),
+    (
+        "CardHint.TLabel",
+        {"foreground": "#4b3c70", "background": "#ffffff", "wraplength": 520},
+    ),
+    (
+        "Badge.TLabel",
+        {
+            "background": "#ece8f6",
+            "foreground": "#5b4b8a",
+            "padding": (10, 4),
+            "font": ("Segoe UI", 9, "bold"),
+        },
+    ),
+    (
+        "Card.TLabelframe",
+        {
+            "background": "#ffffff",
+            "foreground": "#2e1f4f",
+            "borderwidth": 1,
+            "relief": "solid",
+        },
+    ),
+    (
+        "Card.TLabelframe.Label",
+        {"background": "#ffffff", "foreground": "#2e1f4f", "font": _FONT_BOLD},
+    ),
+    (
+        "Accent.TButton",
+        {
+            "padding": (14, 8),
+            "background": "#6d4dd2",
+            "foreground": "#ffffff",
+            "font": _FONT_BOLD,
+        },
+    ),
+    (
+        "Secondary.TButton",
+        {"padding": (12, 8), "background": "#e9e2fb", "foreground": "#3a2d5f"},
+    ),
+    (
+        "Status.TLabel",
+        {"font": _FONT_BASE, "background": "#ece8f6", "foreground": "#4b3c70"},
+    ),
+    ("TCombobox", {"padding": 6}),
+)
+_STYLE_MAPS: Tuple[Tuple[str, Dict[str, object]], ...] = (
+    ("Accent.TButton", {"background": [("active", "#5c3ec2"), ("pressed", "#5c3ec2")]}),
+    (
+        "Secondary.TButton",
+        {"background": [("active", "#dbd1f6"), ("pressed", "#dbd1f6")]},
+    ),
+)
+
+
+def _build_theme_settings() -> Dict[str, Dict[str, Dict[str, object]]]:
+    """Merge the style tables into the shape ``Style.theme_settings`` expects."""
+
+    settings = {name: {"configure": options} for name, options in _STYLE_SPECS}
+    for name, options in _STYLE_MAPS:
+        settings.setdefault(name, {})["map"] = options
+    return settings
+
+
+# theme_settings evaluates every style in one Tcl script instead of one call
+# per configure/map.
+_THEME_SETTINGS = _build_theme_settings()
+_TEXT_WIDGET_OPTIONS: Dict[str, object] = {
+    "wrap": tk.WORD,
+    "font": ("TkDefaultFont", 11),
+    "borderwidth": 0,
+    "highlightthickness": 1,
+    "highlightbackground": "#d9d9d9",
+    "highlightcolor": "#7b61d1",
+    "background": "#ffffff",
+    "foreground": "#2e1f4f",
+    "insertbackground": "#2e1f4f",
+}
+_QUESTION_TEXT_OPTIONS: Dict[str, object] = {
+    **_TEXT_WIDGET_OPTIONS,
+    "height": 3,
+    "width": 60,
+    "padx": 8,
+    "pady": 8,
+}
+_OUTPUT_TEXT_OPTIONS: Dict[str, object] = {
+    **_TEXT_WIDGET_OPTIONS,
+    "padx": 12,
+    "pady": 12,
+    "spacing1": 4,
+    "spacing3": 6,
+}
 
 
 def _preview_subsample_factor(inline_size: int, block_size: int) -> int:
@@ -71,23 +194,183 @@ Drawing a Reading
 * The results panel shows each card with a short interpretation that blends the spread prompt with TarotTeller's knowledge base. When you provide a question, additional personalised insight appears below the reading.
 """
 
+_HELP_TEXT = HELP_TEXT.strip()
+_ABOUT_MESSAGE = (
+    f"{BRAND_NAME}\n"
+    f"Version: {APP_VERSION}\n\n"
+    "Crafted for immersive tarot storytelling with numerology, astrology, and cultural correspondences.\n\n"
+    f"{COPYRIGHT_NOTICE}"
+)
+
+
+def _direct_draw_block(index: int, card: DrawnCard) -> str:
+    meaning = card.meaning
+    correspondences = describe_card_correspondences(card)
+    if meaning and correspondences:
+        body = f"{meaning}\n\n{correspondences}"
+    else:
+        body = meaning or correspondences
+    # One indent pass over the joined body; blank separator lines stay bare.
+    return f"Card {index}: {card.card.name} ({card.orientation})\n{_indent(body, _PROMPT_INDENT)}"
+
 
 def _format_direct_draw(cards: Iterable[DrawnCard]) -> str:
-    formatted: List[str] = []
-    for index, card in enumerate(cards, start=1):
-        meaning = textwrap.indent(card.meaning, "   ")
-        correspondences = textwrap.indent(
-            describe_card_correspondences(card), "   "
+    return "\n\n".join(
+        [_direct_draw_block(index, card) for index, card in enumerate(cards, start=1)]
+    )
+
+
+@dataclass(frozen=True)
+class _DrawRequest:
+    """Snapshot of the form values that decide which cards are drawn."""
+
+    card_count: Optional[int]
+    spread_key: str
+    question: str
+    allow_reversed: bool
+
+
+@dataclass(frozen=True)
+class _Presentation:
+    """Form values that only change how an already drawn reading is rendered."""
+
+    detailed: bool
+    immersive: bool
+    tone: str
+
+
+@dataclass(frozen=True)
+class _DrawnReading:
+    """Cards drawn for a request plus the sections that depend only on them."""
+
+    cards: Tuple[DrawnCard, ...]
+    reading: Optional[SpreadReading]
+    profile: Optional[ContextProfile]
+    body: str
+    opening: str = ""
+    closing: str = ""
+
+
+@dataclass(frozen=True)
+class _DrawResult:
+    text: str
+    first_card: Optional[str]
+    status: str
+
+
+def _join_sections(sections: Iterable[str]) -> str:
+    # Sections are gathered in display order and joined exactly once.
+    return "\n\n".join([section.strip() for section in sections if section])
+
+
+@lru_cache(maxsize=32)
+def _analyze_question_cached(question: str) -> ContextProfile:
+    return analyze_question(question)
+
+
+@lru_cache(maxsize=4)
+def _engine_for(knowledge_base: TarotKnowledgeBase) -> InterpretationEngine:
+    # The engine memoises insight text per card, so keeping one per
+    # knowledge base makes repeat draws (e.g. a fixed seed) reuse that work.
+    return InterpretationEngine(knowledge_base)
+
+
+def _warm_knowledge_base(cards: Iterable[TarotCard], knowledge_base: TarotKnowledgeBase) -> None:
+    """Score every card's themes ahead of the first reading."""
+
+    for card in cards:
+        knowledge_base.themes_for_card(card)
+
+
+def _draw_cards(
+    request: _DrawRequest, deck: TarotDeck, knowledge_base: TarotKnowledgeBase
+) -> _DrawnReading:
+    """Reshuffle ``deck``, draw cards and render the card and question sections.
+
+    Runs on the app's worker thread, so it must not touch Tk widgets.
+    """
+
+    deck.reset(shuffle=True)
+
+    profile = None
+    engine: Optional[InterpretationEngine] = None
+    if request.question:
+        profile = _analyze_question_cached(request.question)
+        engine = _engine_for(knowledge_base)
+
+    if request.card_count:
+        drawn = deck.draw(request.card_count, allow_reversed=request.allow_reversed)
+        opening = closing = ""
+        if engine and profile:
+            insights = [engine.build_card_insight(card, profile) for card in drawn]
+            opening = engine.render_question_response(insights, profile)
+            closing = engine.render_for_cards(insights, profile)
+        return _DrawnReading(
+            cards=tuple(drawn),
+            reading=None,
+            profile=profile,
+            body=_format_direct_draw(drawn),
+            opening=opening,
+            closing=closing,
         )
-        segments = "\n\n".join(
-            segment
-            for segment in (meaning, correspondences)
-            if segment
+
+    if request.spread_key not in SPREADS:
+        raise KeyError(request.spread_key)
+    reading = draw_spread(
+        deck,
+        request.spread_key,
+        allow_reversed=request.allow_reversed,
+    )
+
+    opening = closing = ""
+    if engine and profile:
+        reading_insights: list = engine.insights_for_reading(reading, profile)
+        opening = engine.render_question_response(
+            reading_insights, profile, spread_title=reading.spread.name
         )
-        formatted.append(
-            f"Card {index}: {card.card.name} ({card.orientation})\n{segments}"
+        closing = engine.render_personalised_summary(
+            reading, profile, insights=reading_insights
+        )
+    return _DrawnReading(
+        cards=tuple(placement.card for placement in reading.placements),
+        reading=reading,
+        profile=profile,
+        body=_format_simple_reading(reading, knowledge_base),
+        opening=opening,
+        closing=closing,
+    )
+
+
+def _render_reading(drawn: _DrawnReading, presentation: _Presentation) -> _DrawResult:
+    """Assemble the output text, rendering only the presentation-specific parts."""
+
+    body = drawn.body
+    if presentation.detailed and drawn.reading is not None:
+        body = drawn.reading.as_text()
+    sections = [drawn.opening, body, drawn.closing]
+    if presentation.immersive:
+        sections.append(
+            build_immersive_companion(
+                drawn.cards, tone=presentation.tone, profile=drawn.profile
+            )
         )
-    return "\n\n".join(formatted)
+    return _DrawResult(
+        text=_join_sections(sections),
+        first_card=drawn.cards[0].card.name if drawn.cards else None,
+        status="Direct draw ready." if drawn.reading is None else "Reading ready.",
+    )
+
+
+def _compose_reading(
+    request: _DrawRequest,
+    presentation: _Presentation,
+    deck: TarotDeck,
+    knowledge_base: TarotKnowledgeBase,
+) -> Tuple[_DrawnReading, _DrawResult]:
+    """Draw and render a reading; the drawn half is what the app caches."""
+
+    drawn = _draw_cards(request, deck, knowledge_base)
+    return drawn, _render_reading(drawn, presentation)
 
 
 class TarotTellerApp:
@@ -100,6 +383,21 @@ class TarotTellerApp:
         self.deck = TarotDeck()
         self._help_window: Optional[tk.Toplevel] = None
         self._preview_image: Optional[tk.PhotoImage] = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_draw: Optional[Future] = None
+        self._pending_key: Optional[Tuple[int, _DrawRequest]] = None
+        # Seeded draws are deterministic, so recent ones are kept and only
+        # re-rendered when the tone, detail or immersive options change.
+        self._reading_cache: OrderedDict[Tuple[int, _DrawRequest], _DrawnReading] = (
+            OrderedDict()
+        )
+        self._knowledge_base: Optional[TarotKnowledgeBase] = None
+        self._knowledge_base_deck: Optional[TarotDeck] = None
+        self._last_seed: Optional[int] = None
+        self._question_text = ""
+        self._question_dirty = False
+        self._debounce_ids: Dict[str, str] = {}
+        self._pending_status: Optional[str] = None
         self.spread_var = tk.StringVar(value="single")
         self.card_count = tk.StringVar(value="")
         self.seed_var = tk.StringVar(value="")
@@ -113,6 +411,10 @@ class TarotTellerApp:
         self._build_menu()
         self._build_layout()
         self._set_status("Welcome to TarotTeller Studio.")
+        # Runs on the single worker before any draw is queued behind it.
+        self._executor.submit(
+            _warm_knowledge_base, self.deck.all_cards, self._current_knowledge_base()
+        )
 
     def _build_layout(self) -> None:
         self.root.geometry("980x720")
@@ -158,11 +460,10 @@ class TarotTellerApp:
         ttk.Label(controls, text="Spread:", style="Card.TLabel").grid(
             row=0, column=0, sticky=tk.W
         )
-        spread_choices = sorted(SPREADS.keys())
         self.spread_box = ttk.Combobox(
             controls,
             textvariable=self.spread_var,
-            values=spread_choices,
+            values=_SPREAD_CHOICES,
             state="readonly",
             width=18,
         )
@@ -182,27 +483,11 @@ class TarotTellerApp:
         ttk.Label(controls, text="Question:", style="Card.TLabel").grid(
             row=1, column=0, sticky=tk.NW, pady=(12, 0)
         )
-        self.question = tk.Text(
-            controls,
-            height=3,
-            width=60,
-            wrap=tk.WORD,
-            font=("TkDefaultFont", 11),
-        )
+        self.question = tk.Text(controls, **_QUESTION_TEXT_OPTIONS)
         self.question.grid(
             row=1, column=1, columnspan=4, sticky=tk.EW, pady=(12, 0)
         )
-        self.question.configure(
-            borderwidth=0,
-            highlightthickness=1,
-            highlightbackground="#d9d9d9",
-            highlightcolor="#7b61d1",
-            padx=8,
-            pady=8,
-            background="#ffffff",
-            foreground="#2e1f4f",
-            insertbackground="#2e1f4f",
-        )
+        self.question.bind("<<Modified>>", self._on_question_modified)
 
         ttk.Label(
             controls,
@@ -242,11 +527,10 @@ class TarotTellerApp:
         ttk.Label(options, text="Tone:", style="Card.TLabel").pack(
             side=tk.LEFT, padx=(16, 4)
         )
-        self.tone = tk.StringVar(value="radiant")
         tone_menu = ttk.Combobox(
             options,
             textvariable=self.tone,
-            values=["radiant", "mystic", "grounded"],
+            values=_TONE_CHOICES,
             state="readonly",
             width=10,
         )
@@ -267,9 +551,10 @@ class TarotTellerApp:
 
         actions = ttk.Frame(container, style="App.TFrame")
         actions.pack(fill=tk.X, pady=(0, 16))
-        ttk.Button(
+        self.draw_button = ttk.Button(
             actions, text="Draw Reading", style="Accent.TButton", command=self.draw_reading
-        ).pack(side=tk.LEFT)
+        )
+        self.draw_button.pack(side=tk.LEFT)
         ttk.Button(
             actions, text="Reset Deck", style="Secondary.TButton", command=self.reset_deck
         ).pack(side=tk.LEFT, padx=(12, 0))
@@ -289,21 +574,8 @@ class TarotTellerApp:
         self.preview_image_label = ttk.Label(preview_frame, style="Card.TLabel", width=32)
         self.preview_image_label.pack(anchor=tk.N, pady=(8, 0))
 
-        self.output = tk.Text(output_frame, wrap=tk.WORD, font=("TkDefaultFont", 11))
+        self.output = tk.Text(output_frame, **_OUTPUT_TEXT_OPTIONS)
         self.output.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        self.output.configure(
-            borderwidth=0,
-            highlightthickness=1,
-            highlightbackground="#d9d9d9",
-            highlightcolor="#7b61d1",
-            padx=12,
-            pady=12,
-            spacing1=4,
-            spacing3=6,
-            background="#ffffff",
-            foreground="#2e1f4f",
-            insertbackground="#2e1f4f",
-        )
 
         scrollbar = ttk.Scrollbar(output_frame, command=self.output.yview)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -319,95 +591,18 @@ class TarotTellerApp:
         status.pack(fill=tk.X, side=tk.BOTTOM)
 
     def _configure_style(self) -> None:
+        # ttk styles live on the Tk interpreter, so apply them once per root.
+        if self.root in _STYLED_ROOTS:
+            return
         style = ttk.Style(self.root)
         try:
             style.theme_use("clam")
         except tk.TclError:
             pass
 
-        self.root.option_add("*Font", ("Segoe UI", 10))
-
-        style.configure("TFrame", background="#f6f4fb")
-        style.configure("TLabel", background="#f6f4fb", foreground="#2e1f4f")
-        style.configure("TSeparator", background="#e4ddf3")
-        style.configure("App.TFrame", background="#f6f4fb")
-        style.configure(
-            "Brand.TLabel",
-            font=("Segoe UI", 22, "bold"),
-            foreground="#2e1f4f",
-        )
-        style.configure(
-            "SubBrand.TLabel",
-            font=("Segoe UI", 11),
-            foreground="#5b4b8a",
-        )
-        style.configure(
-            "Hint.TLabel",
-            foreground="#4b3c70",
-            background="#f6f4fb",
-            wraplength=520,
-        )
-        style.configure("Card.TFrame", background="#ffffff")
-        style.configure(
-            "Card.TLabel",
-            background="#ffffff",
-            foreground="#2e1f4f",
-        )
-        style.configure(
-            "CardHint.TLabel",
-            foreground="#4b3c70",
-            background="#ffffff",
-            wraplength=520,
-        )
-        style.configure(
-            "Badge.TLabel",
-            background="#ece8f6",
-            foreground="#5b4b8a",
-            padding=(10, 4),
-            font=("Segoe UI", 9, "bold"),
-        )
-        style.configure(
-            "Card.TLabelframe",
-            background="#ffffff",
-            foreground="#2e1f4f",
-            borderwidth=1,
-            relief="solid",
-        )
-        style.configure(
-            "Card.TLabelframe.Label",
-            background="#ffffff",
-            foreground="#2e1f4f",
-            font=("Segoe UI", 10, "bold"),
-        )
-        style.configure(
-            "Accent.TButton",
-            padding=(14, 8),
-            background="#6d4dd2",
-            foreground="#ffffff",
-            font=("Segoe UI", 10, "bold"),
-        )
-        style.map(
-            "Accent.TButton",
-            background=[("active", "#5c3ec2"), ("pressed", "#5c3ec2")],
-        )
-        style.configure(
-            "Secondary.TButton",
-            padding=(12, 8),
-            background="#e9e2fb",
-            foreground="#3a2d5f",
-        )
-        style.map(
-            "Secondary.TButton",
-            background=[("active", "#dbd1f6"), ("pressed", "#dbd1f6")],
-        )
-        style.configure(
-            "Status.TLabel",
-            font=("Segoe UI", 10),
-            background="#ece8f6",
-            foreground="#4b3c70",
-        )
-        style.configure("TCombobox", padding=6)
-
+        self.root.option_add("*Font", _FONT_BASE)
+        style.theme_settings(style.theme_use(), _THEME_SETTINGS)
+        _STYLED_ROOTS.add(self.root)
 
     def _build_menu(self) -> None:
         menubar = tk.Menu(self.root)
@@ -469,7 +664,7 @@ class TarotTellerApp:
             label="Immersive Companion", variable=self.immersive
         )
         tone_menu = tk.Menu(view_menu)
-        for tone in ("radiant", "mystic", "grounded"):
+        for tone in _TONE_CHOICES:
             tone_menu.add_radiobutton(
                 label=tone.title(), value=tone, variable=self.tone
             )
@@ -483,40 +678,50 @@ class TarotTellerApp:
 
         self.root.config(menu=menubar)
 
-        self.root.bind_all("<Control-Return>", self._trigger_draw)
-        self.root.bind_all("<Control-KP_Enter>", self._trigger_draw)
-        self.root.bind_all("<Control-r>", self._trigger_reset)
-        self.root.bind_all("<Control-R>", self._trigger_reset)
-        self.root.bind_all("<Control-q>", lambda event: self.root.quit())
-        self.root.bind_all("<Control-Q>", lambda event: self.root.quit())
-        self.root.bind_all("<Control-l>", self._trigger_clear)
-        self.root.bind_all("<Control-L>", self._trigger_clear)
-        self.root.bind_all("<F1>", self._trigger_help)
-        self.root.bind_all("<Control-s>", self._trigger_export)
-        self.root.bind_all("<Control-S>", self._trigger_export)
-        self.root.bind_all("<Control-Shift-C>", self._trigger_copy_output)
-        self.root.bind_all("<Control-Shift-Q>", self._trigger_copy_question)
-        self.root.bind_all("<Control-Shift-L>", self._trigger_clear_question)
+        accelerators = (
+            (("<Control-Return>", "<Control-KP_Enter>"), self._trigger_draw),
+            (("<Control-r>", "<Control-R>"), self._trigger_reset),
+            (("<Control-q>", "<Control-Q>"), self._trigger_quit),
+            (("<Control-l>", "<Control-L>"), self._trigger_clear),
+            (("<F1>",), self._trigger_help),
+            (("<Control-s>", "<Control-S>"), self._trigger_export),
+            (("<Control-Shift-C>",), self._trigger_copy_output),
+            (("<Control-Shift-Q>",), self._trigger_copy_question),
+            (("<Control-Shift-L>",), self._trigger_clear_question),
+        )
+        for sequences, handler in accelerators:
+            for sequence in sequences:
+                self.root.bind_all(sequence, handler)
 
     def run(self) -> None:
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self._executor.shutdown(wait=False)
 
     def reset_deck(self) -> None:
-        seed_text = self.seed_var.get().strip()
+        if self._pending_draw is not None:
+            self._set_status("Wait for the current reading before resetting the deck.")
+            return
         try:
-            seed_value = int(seed_text) if seed_text else None
+            seed_value = self._parse_optional_int(self.seed_var.get())
         except ValueError:
             messagebox.showerror("Invalid seed", "Seed must be an integer value.")
             self._set_status("Deck reset aborted: invalid seed.")
             return
-        self.deck = TarotDeck()
-        if seed_value is not None:
-            self.deck.seed(seed_value)
+        # Reuse the deck (and the knowledge base built from it); seeding with
+        # None draws fresh entropy just like a newly constructed deck.
+        self.deck.seed(seed_value)
         self.deck.reset(shuffle=True)
+        self._last_seed = seed_value
         messagebox.showinfo("Deck reset", "Deck reshuffled and ready for a new reading.")
         self._set_status("Deck reset and reshuffled.")
 
     def draw_reading(self) -> None:
+        if self._pending_draw is not None:
+            self._set_status("Still drawing the previous reading…")
+            return
+
         try:
             seed_value = self._parse_optional_int(self.seed_var.get())
         except ValueError:
@@ -531,96 +736,97 @@ class TarotTellerApp:
             self._set_status("Reading aborted: invalid card count.")
             return
 
-        deck = TarotDeck()
-        knowledge_base = TarotKnowledgeBase(deck.all_cards)
-        if seed_value is not None:
-            deck.seed(seed_value)
-        deck.reset(shuffle=True)
+        request = _DrawRequest(
+            card_count=card_count,
+            spread_key=self.spread_var.get() or "single",
+            question=self._question_value(),
+            allow_reversed=self.allow_reversed.get(),
+        )
+        presentation = _Presentation(
+            detailed=self.detailed.get(),
+            immersive=self.immersive.get(),
+            tone=self.tone.get(),
+        )
+        cache_key = (seed_value, request) if seed_value is not None else None
+        if cache_key is not None:
+            cached = self._reading_cache.get(cache_key)
+            if cached is not None:
+                self._reading_cache.move_to_end(cache_key)
+                self._last_seed = seed_value
+                self._apply_draw_result(_render_reading(cached, presentation))
+                return
 
-        question = self.question.get("1.0", tk.END).strip()
-        profile = None
-        engine: Optional[InterpretationEngine] = None
-        if question:
-            profile = analyze_question(question)
-            engine = InterpretationEngine(knowledge_base)
+        self._pending_key = cache_key
+        self.draw_button.state(["disabled"])
+        self._set_status("Drawing your reading…")
+        self._pending_draw = self._executor.submit(
+            _compose_reading,
+            request,
+            presentation,
+            self._prepare_deck(seed_value),
+            self._current_knowledge_base(),
+        )
+        self.root.after(_DRAW_POLL_MS, self._poll_draw)
 
-        allow_reversed = self.allow_reversed.get()
+    def _prepare_deck(self, seed_value: Optional[int]) -> TarotDeck:
+        # Reseed on every seeded draw so the same seed always repeats the same
+        # reading; once the seed is cleared, return to an entropy-seeded RNG.
+        if seed_value is not None:
+            self.deck.seed(seed_value)
+        elif self._last_seed is not None:
+            self.deck.seed(None)
+        self._last_seed = seed_value
+        return self.deck
+
+    def _current_knowledge_base(self) -> TarotKnowledgeBase:
+        # Rebuild only when the deck is replaced so theme caches survive draws.
+        if self._knowledge_base is None or self._knowledge_base_deck is not self.deck:
+            self._knowledge_base = TarotKnowledgeBase(self.deck.all_cards)
+            self._knowledge_base_deck = self.deck
+        return self._knowledge_base
+
+    def _poll_draw(self) -> None:
+        # Tk is not thread-safe, so the worker's result is collected here on
+        # the UI thread rather than from a future callback.
+        future = self._pending_draw
+        if future is None:
+            return
+        if not future.done():
+            self.root.after(_DRAW_POLL_MS, self._poll_draw)
+            return
 
+        self._pending_draw = None
+        cache_key, self._pending_key = self._pending_key, None
+        self.draw_button.state(["!disabled"])
         try:
-            if card_count:
-                drawn = deck.draw(card_count, allow_reversed=allow_reversed)
-                rendered = _format_direct_draw(drawn)
-                sections: List[str] = [rendered]
-                if engine and profile:
-                    insights = [engine.build_card_insight(card, profile) for card in drawn]
-                    response = engine.render_question_response(insights, profile)
-                    if response:
-                        sections.insert(0, response)
-                    sections.append(engine.render_for_cards(insights, profile))
-                if self.immersive.get():
-                    sections.append(
-                        build_immersive_companion(
-                            drawn, tone=self.tone.get(), profile=profile
-                        )
-                    )
-                self._render_output("\n\n".join(section.strip() for section in sections if section))
-                self._update_image_preview(drawn[0].card.name if drawn else None)
-                self._set_status("Direct draw ready.")
-                return
-
-            spread_key = self.spread_var.get() or "single"
-            if spread_key not in SPREADS:
-                raise KeyError(spread_key)
-            reading = draw_spread(
-                deck,
-                spread_key,
-                allow_reversed=allow_reversed,
-            )
+            drawn, result = future.result()
         except (ValueError, KeyError) as exc:
             messagebox.showerror("Unable to draw", str(exc))
             self._set_status("Reading aborted: unable to draw spread.")
             return
 
-        rendered = (
-            reading.as_text()
-            if self.detailed.get()
-            else _format_simple_reading(reading, knowledge_base)
-        )
-        sections = [rendered]
-        if engine and profile:
-            reading_insights: list = engine.insights_for_reading(reading, profile)
-            response = engine.render_question_response(
-                reading_insights, profile, spread_title=reading.spread.name
-            )
-            if response:
-                sections.insert(0, response)
-            sections.append(
-                engine.render_personalised_summary(
-                    reading, profile, insights=reading_insights
-                )
-            )
+        if cache_key is not None:
+            self._reading_cache[cache_key] = drawn
+            if len(self._reading_cache) > _READING_CACHE_SIZE:
+                self._reading_cache.popitem(last=False)
+        self._apply_draw_result(result)
 
-        if self.immersive.get():
-            sections.append(
-                build_immersive_companion(
-                    [placement.card for placement in reading.placements],
-                    tone=self.tone.get(),
-                    profile=profile,
-                )
-            )
-
-        self._render_output("\n\n".join(section.strip() for section in sections if section))
-        first_card_name = reading.placements[0].card.card.name if reading.placements else None
-        self._update_image_preview(first_card_name)
-        self._set_status("Reading ready.")
+    def _apply_draw_result(self, result: _DrawResult) -> None:
+        self._render_output(result.text)
+        self._update_image_preview(result.first_card)
+        self._set_status(result.status)
 
     def _render_output(self, text: str) -> None:
-        self.output.delete("1.0", tk.END)
-        self.output.insert(tk.END, text.strip())
-        self.output.see("1.0")
-        if not text.strip():
+        text = text.strip()
+        if not text:
+            self.output.delete("1.0", tk.END)
             self._update_image_preview(None)
             self._set_status("Output cleared.")
+            return
+        self.output.replace("1.0", tk.END, text)
+        # Park the cursor at the top so Tk scrolls once, not to the end first.
+        self.output.mark_set(tk.INSERT, "1.0")
+        self.output.see("1.0")
 
     def _update_image_preview(self, card_name: Optional[str]) -> None:
         if not card_name:
@@ -661,7 +867,7 @@ class TarotTellerApp:
         frame.pack(fill=tk.BOTH, expand=True)
 
         text_widget = tk.Text(frame, wrap=tk.WORD, font=("TkDefaultFont", 11))
-        text_widget.insert(tk.END, HELP_TEXT.strip())
+        text_widget.insert(tk.END, _HELP_TEXT)
         text_widget.configure(state=tk.DISABLED)
         text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
@@ -680,13 +886,7 @@ class TarotTellerApp:
         self._set_status("Help window closed.")
 
     def _show_about(self) -> None:
-        message = (
-            f"{BRAND_NAME}\n"
-            f"Version: {APP_VERSION}\n\n"
-            "Crafted for immersive tarot storytelling with numerology, astrology, and cultural correspondences.\n\n"
-            f"{COPYRIGHT_NOTICE}"
-        )
-        messagebox.showinfo("About TarotTeller", message)
+        messagebox.showinfo("About TarotTeller", _ABOUT_MESSAGE)
         self._set_status("About dialog displayed.")
 
     @staticmethod
@@ -697,14 +897,36 @@ class TarotTellerApp:
         return int(value)
 
     def _set_status(self, message: str) -> None:
-        self.status_var.set(message)
+        # Several status updates can land in one event; only the last one is
+        # ever visible, so write the variable once when Tk goes idle.
+        if self._pending_status is None:
+            self.root.after_idle(self._flush_status)
+        self._pending_status = message
+
+    def _flush_status(self) -> None:
+        if self._pending_status is not None:
+            self.status_var.set(self._pending_status)
+            self._pending_status = None
+
+    def _debounce(self, key: str, callback: Callable[[], None]) -> None:
+        # Keyboard autorepeat fires accelerators many times a second; restart
+        # the timer on each press so a held key runs ``callback`` only once.
+        after_id = self._debounce_ids.pop(key, None)
+        if after_id is not None:
+            self.root.after_cancel(after_id)
+
+        def run() -> None:
+            self._debounce_ids.pop(key, None)
+            callback()
+
+        self._debounce_ids[key] = self.root.after(_KEY_DEBOUNCE_MS, run)
 
     def _trigger_draw(self, event: Optional[tk.Event] = None) -> str:
-        self.draw_reading()
+        self._debounce("draw", self.draw_reading)
         return "break"
 
     def _trigger_reset(self, event: Optional[tk.Event] = None) -> str:
-        self.reset_deck()
+        self._debounce("reset", self.reset_deck)
         return "break"
 
     def _clear_output(self) -> None:
@@ -753,8 +975,26 @@ class TarotTellerApp:
         self.root.clipboard_append(content)
         self._set_status("Reading copied to clipboard.")
 
+    def _on_question_modified(self, event: Optional[tk.Event] = None) -> None:
+        # Clearing the flag fires <<Modified>> again; ignore that echo.
+        if not self.question.edit_modified():
+            return
+        self._question_dirty = True
+        # Reset the flag so Tk fires <<Modified>> again on the next edit.
+        self.question.edit_modified(False)
+
+    def _question_value(self) -> str:
+        # Only marshal the Text buffer when it changed since the last read. Tk
+        # sets the modified flag during the edit itself but delivers
+        # <<Modified>> later, so the flag catches edits still awaiting it.
+        if self._question_dirty or self.question.edit_modified():
+            self._question_text = self.question.get("1.0", tk.END).strip()
+            self._question_dirty = False
+            self.question.edit_modified(False)
+        return self._question_text
+
     def _copy_question(self) -> None:
-        content = self.question.get("1.0", tk.END).strip()
+        content = self._question_value()
         if not content:
             self._set_status("Nothing to copy from the question field.")
             return
@@ -782,6 +1022,10 @@ class TarotTellerApp:
         self._clear_question()
         return "break"
 
+    def _trigger_quit(self, event: Optional[tk.Event] = None) -> str:
+        self.root.quit()
+        return "break"
+
     def _trigger_help(self, event: Optional[tk.Event] = None) -> str:
         self._show_help()
         return "break"
@@ -789,15 +1033,15 @@ class TarotTellerApp:
 
 def _format_simple_reading(reading: SpreadReading, knowledge_base: TarotKnowledgeBase) -> str:
     """Render a concise summary of the spread reading."""
-    lines = []
-    for placement in reading.placements:
-        card = placement.card
-        meaning = card.meaning
-        lines.append(
-            f"{placement.position}: {card.card.name} ({card.orientation})\n"
-            f"   {meaning}"
-        )
-    return "\n\n".join(lines)
+    return "\n\n".join(
+        [
+            f"{placement.position.index}. {placement.card.card.name} "
+            f"({placement.card.orientation})\n"
+            f"{_PROMPT_WRAPPER.fill(placement.position.prompt)}\n"
+            f"{_indent(placement.card.meaning, _PROMPT_INDENT)}"
+            for placement in reading.placements
+        ]
+    )
 
 def launch() -> None:
 
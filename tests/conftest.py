@@ -0,0 +1,36 @@
+"""Shared pytest fixtures for the TarotTeller test suite."""
+
+from __future__ import annotations
+
+import random
+from typing import Callable
+
+import pytest
+
+from tarotteller import TarotDeck, TarotKnowledgeBase
+
+
+@pytest.fixture(scope="session")
+def tarot_deck() -> TarotDeck:
+    """A deck shared by tests that only look cards up; never draw from it."""
+
+    return TarotDeck()
+
+
+@pytest.fixture(scope="session")
+def knowledge_base(tarot_deck: TarotDeck) -> TarotKnowledgeBase:
+    """A knowledge base over the full deck, shared because it only caches themes."""
+
+    return TarotKnowledgeBase(tarot_deck.all_cards)
+
+
+@pytest.fixture
+def seeded_deck() -> Callable[[int], TarotDeck]:
+    """Return a factory for fresh decks shuffled from ``seed``."""
+
+    def _make(seed: int) -> TarotDeck:
+        # Seeding the constructor's RNG yields the same order as seed() plus
+        # reset(shuffle=True), without shuffling the deck a second time.
+        return TarotDeck(rng=random.Random(seed))
+
+    return _make
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import json
+import os
+import time
 from pathlib import Path
+from typing import Any, Callable
 
 import pytest
 
@@ -16,6 +19,7 @@ from tarotteller.core import (
     analyze_question,
     draw_spread,
 )
+from tarotteller.core.ai_engine import _AuditLog
 
 
 class DummyClient:
@@ -32,6 +36,21 @@ class DummyClient:
         return json.dumps(self._payload)
 
 
+EngineFactory = Callable[..., tuple[AIEngine, DummyClient]]
+
+
+@pytest.fixture
+def make_engine(tmp_path: Path) -> EngineFactory:
+    """Build an :class:`AIEngine` around a :class:`DummyClient` logging to ``tmp_path``."""
+
+    def _make(payload: dict, **kwargs: Any) -> tuple[AIEngine, DummyClient]:
+        client = DummyClient(payload)
+        kwargs.setdefault("log_path", tmp_path / "ai.log")
+        return AIEngine(client=client, **kwargs), client
+
+    return _make
+
+
 @pytest.fixture
 def spread_payload() -> dict:
     return {
@@ -57,7 +76,9 @@ def spread_payload() -> dict:
     }
 
 
-def test_generate_reading_parses_payload_and_logs(tmp_path: Path, spread_payload: dict) -> None:
+def test_generate_reading_parses_payload_and_logs(
+    tmp_path: Path, spread_payload: dict, make_engine: EngineFactory
+) -> None:
     response = {
         "summary": "A moment of transition asks for mindful choices.",
         "tone": "mystic",
@@ -77,9 +98,8 @@ def test_generate_reading_parses_payload_and_logs(tmp_path: Path, spread_payload
         ],
         "response_id": "abc123",
     }
-    client = DummyClient(response)
+    engine, client = make_engine(response, model="gpt-test", temperature=0.2)
     log_path = tmp_path / "ai.log"
-    engine = AIEngine(model="gpt-test", temperature=0.2, client=client, log_path=log_path)
 
     result = engine.generate_reading("<script>How do I stay focused?</script>", spread_payload)
 
@@ -89,6 +109,7 @@ def test_generate_reading_parses_payload_and_logs(tmp_path: Path, spread_payload
     assert client.model == "gpt-test"
     assert client.temperature == 0.2
     assert "<" not in client.prompt
+    engine.flush_audit_log()
     assert log_path.exists()
     log_contents = log_path.read_text(encoding="utf-8")
     assert "gpt-test" in log_contents
@@ -96,17 +117,21 @@ def test_generate_reading_parses_payload_and_logs(tmp_path: Path, spread_payload
 
 
 def test_generate_reading_validates_response(spread_payload: dict) -> None:
+    # The response is rejected before any audit record is buffered, so the
+    # test needs neither a tmp_path directory nor a real log file.
     client = DummyClient({"summary": "", "card_insights": []})
-    engine = AIEngine(client=client)
+    engine = AIEngine(client=client, log_path=Path(os.devnull))
 
     with pytest.raises(ValueError):
         engine.generate_reading("What next?", spread_payload)
 
 
-def test_interpretation_engine_generate_ai_reading(tmp_path: Path) -> None:
-    deck = TarotDeck()
-    deck.seed(7)
-    deck.reset(shuffle=True)
+def test_interpretation_engine_generate_ai_reading(
+    seeded_deck: Callable[[int], TarotDeck],
+    knowledge_base: TarotKnowledgeBase,
+    make_engine: EngineFactory,
+) -> None:
+    deck = seeded_deck(7)
     reading = draw_spread(deck, "three_card", rng=13)
     profile = analyze_question("How do I nurture my creative work this season?")
     insights = [
@@ -124,10 +149,8 @@ def test_interpretation_engine_generate_ai_reading(tmp_path: Path) -> None:
         "card_insights": insights,
         "response_id": "test-response",
     }
-    client = DummyClient(payload)
-    ai_engine = AIEngine(client=client, log_path=tmp_path / "ai.log")
-    knowledge = TarotKnowledgeBase(deck.all_cards)
-    engine = InterpretationEngine(knowledge)
+    ai_engine, _ = make_engine(payload)
+    engine = InterpretationEngine(knowledge_base)
 
     ai_reading = engine.generate_ai_reading(reading, profile, ai_engine=ai_engine, question=profile.question)
 
@@ -137,3 +160,109 @@ def test_interpretation_engine_generate_ai_reading(tmp_path: Path) -> None:
     rendered = engine.render_ai_reading(ai_reading, profile)
     assert "AI-Assisted Reading" in rendered
     assert "Creativity blossoms" in rendered
+
+
+def test_generate_reading_caches_deterministic_responses(
+    tmp_path: Path, spread_payload: dict, make_engine: EngineFactory
+) -> None:
+    response = {
+        "summary": "Stillness brings clarity.",
+        "card_insights": [
+            {"card": "The Fool", "position": "Past", "message": "Trust the leap."},
+        ],
+        "response_id": "first",
+    }
+    engine, client = make_engine(response, temperature=0)
+    log_path = tmp_path / "ai.log"
+
+    first = engine.generate_reading("What next?", spread_payload)
+    client.prompt = None
+    second = engine.generate_reading("What next?", spread_payload)
+
+    assert client.prompt is None
+    assert second == first
+    assert second is not first
+    engine.flush_audit_log()
+    assert "cached" in log_path.read_text(encoding="utf-8")
+
+
+def test_generate_reading_skips_cache_for_sampled_temperatures(
+    spread_payload: dict, make_engine: EngineFactory
+) -> None:
+    response = {
+        "summary": "Momentum gathers.",
+        "card_insights": [
+            {"card": "The Fool", "position": "Past", "message": "Begin again."},
+        ],
+    }
+    engine, client = make_engine(response, temperature=0.7)
+
+    engine.generate_reading("What next?", spread_payload)
+    client.prompt = None
+    engine.generate_reading("What next?", spread_payload)
+
+    assert client.prompt is not None
+
+
+def test_audit_log_writes_are_batched(
+    tmp_path: Path, spread_payload: dict, make_engine: EngineFactory
+) -> None:
+    response = {
+        "summary": "Patience rewards you.",
+        "card_insights": [
+            {"card": "The Fool", "position": "Past", "message": "Wait a beat."},
+        ],
+    }
+    engine, _ = make_engine(response, cache_mode="off", log_batch_size=2)
+    log_path = tmp_path / "ai.log"
+
+    engine.generate_reading("What next?", spread_payload)
+    assert not log_path.exists()
+
+    engine.generate_reading("What next?", spread_payload)
+    assert len(log_path.read_text(encoding="utf-8").splitlines()) == 2
+
+
+def test_audit_log_flushes_a_lone_record_after_the_interval(tmp_path: Path) -> None:
+    log_path = tmp_path / "ai.log"
+    audit_log = _AuditLog(log_path, batch_size=10, flush_interval=0.05)
+
+    audit_log.append("only record\n")
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        if log_path.exists() and log_path.read_text(encoding="utf-8"):
+            break
+        time.sleep(0.01)
+
+    assert log_path.read_text(encoding="utf-8") == "only record\n"
+    audit_log.close()
+
+
+def test_ai_reading_to_dict_copies_insights_only_when_deep() -> None:
+    insight = {"card": "The Star", "message": "Hope returns."}
+    reading = AIReading(
+        summary="Renewal.", tone="radiant", card_insights=[insight], model="gpt-test"
+    )
+
+    assert reading.to_dict()["card_insights"][0] is insight
+    deep_copy = reading.to_dict(deep=True)["card_insights"][0]
+    assert deep_copy == insight and deep_copy is not insight
+
+
+def test_generate_reading_accepts_decoded_payloads(
+    tmp_path: Path, spread_payload: dict
+) -> None:
+    response = {
+        "summary": "The path is already lit.",
+        "card_insights": [
+            {"card": "The Fool", "position": "Past", "message": "Step forward."},
+        ],
+    }
+    engine = AIEngine(
+        client=lambda **_: response, log_path=tmp_path / "ai.log", cache_mode="off"
+    )
+
+    result = engine.generate_reading("What next?", spread_payload)
+
+    assert result["summary"] == response["summary"]
+    assert result["card_insights"][0]["orientation"] == "upright"
@@ -71,3 +71,12 @@ def test_cli_draw_with_immersive_extras(capsys):
     assert "Immersive Companion" in captured.out
     assert "Micro-Ritual" in captured.out
     assert "Soundscape" in captured.out
+
+
+def test_cli_repeated_runs_do_not_share_options(capsys):
+    assert run_cli(["draw", "--cards", "1", "--seed", "3", "--immersive"]) == 0
+    first = capsys.readouterr().out
+    assert run_cli(["draw", "--cards", "1", "--seed", "3"]) == 0
+    second = capsys.readouterr().out
+    assert "Immersive Companion" in first
+    assert "Immersive Companion" not in second
@@ -1,18 +1,18 @@
-from tarotteller import DrawnCard, TarotDeck
+from collections import Counter
 
+from tarotteller import DrawnCard, TarotDeck, describe_card_correspondences
+from tarotteller.core.correspondences import _reduce_to_chaldean
 
-def test_deck_contains_full_set():
-    deck = TarotDeck()
-    cards = deck.all_cards
+
+def test_deck_contains_full_set(tarot_deck):
+    cards = tarot_deck.all_cards
     assert len(cards) == 78
-    assert sum(1 for card in cards if card.arcana == "major") == 22
-    assert sum(1 for card in cards if card.arcana == "minor") == 56
+    assert Counter(card.arcana for card in cards) == {"major": 22, "minor": 56}
     assert len({card.name for card in cards}) == 78
 
 
-def test_get_card_case_insensitive():
-    deck = TarotDeck()
-    card = deck.get_card(" the fool ")
+def test_get_card_case_insensitive(tarot_deck):
+    card = tarot_deck.get_card(" the fool ")
     assert card is not None
     assert card.name == "The Fool"
 
@@ -25,17 +25,22 @@ def test_draw_reduces_stack():
     assert len(deck) == original_remaining - 3
 
 
-def test_draw_without_reversals():
+def test_draw_takes_cards_from_top_of_stack():
     deck = TarotDeck()
-    deck.seed(123)
-    deck.reset(shuffle=True)
+    stack = list(deck)
+    drawn = deck.draw(3)
+    assert [card.card for card in drawn] == stack[:3]
+    assert list(deck) == stack[3:]
+
+
+def test_draw_without_reversals(seeded_deck):
+    deck = seeded_deck(123)
     drawn = deck.draw(5, allow_reversed=False)
     assert all(not card.is_reversed for card in drawn)
 
 
-def test_major_arcana_sequence_matches_reference():
-    deck = TarotDeck()
-    majors = [card.name for card in deck.list_cards(arcana="major")]
+def test_major_arcana_sequence_matches_reference(tarot_deck):
+    majors = [card.name for card in tarot_deck.list_cards(arcana="major")]
     expected = [
         "The Fool",
         "The Magician",
@@ -63,9 +68,8 @@ def test_major_arcana_sequence_matches_reference():
     assert majors == expected
 
 
-def test_meaning_includes_orientation_specific_guidance():
-    deck = TarotDeck()
-    card = deck.get_card("The Lovers")
+def test_meaning_includes_orientation_specific_guidance(tarot_deck):
+    card = tarot_deck.get_card("The Lovers")
     assert card is not None
 
     upright = DrawnCard(card=card, is_reversed=False).meaning
@@ -76,3 +80,31 @@ def test_meaning_includes_orientation_specific_guidance():
 
     assert "Reversed, The Lovers signals" in reversed_meaning
     assert "Notice where the energy feels stalled" in reversed_meaning
+
+
+def test_get_card_ignores_inner_whitespace(tarot_deck):
+    card = tarot_deck.get_card("  KING   of\tpentacles ")
+    assert card is not None
+    assert card.name == "King of Pentacles"
+    assert tarot_deck.get_card("Queen of Coins") is None
+
+
+def test_card_correspondences_follow_orientation(tarot_deck):
+    card = tarot_deck.get_card("The Star")
+    upright = describe_card_correspondences(DrawnCard(card=card))
+    reversed_ = describe_card_correspondences(DrawnCard(card=card, is_reversed=True))
+    assert "Outward expression" in upright
+    assert "Inner reflection" in reversed_
+    assert describe_card_correspondences(DrawnCard(card=card)) is upright
+
+
+def test_chaldean_reduction_matches_repeated_digit_sums():
+    def digit_sum_reduce(number):
+        if number <= 0:
+            return 0
+        while number > 9:
+            number = sum(int(digit) for digit in str(number))
+        return number
+
+    for number in range(-5, 5000):
+        assert _reduce_to_chaldean(number) == digit_sum_reduce(number)
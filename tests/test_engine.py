@@ -1,6 +1,12 @@
+import gc
+import sys
+import weakref
+
+import pytest
+
 from tarotteller import (
     InterpretationEngine,
-    TarotDeck,
+    PersonalizedInsight,
     TarotKnowledgeBase,
     analyze_question,
     build_prompt_interpretation,
@@ -8,16 +14,14 @@ from tarotteller import (
 )
 
 
-def test_render_personalised_summary_creates_story_arc():
-    deck = TarotDeck()
-    deck.seed(11)
-    deck.reset(shuffle=True)
+def test_render_personalised_summary_creates_story_arc(seeded_deck, knowledge_base):
+    deck = seeded_deck(11)
     reading = draw_spread(deck, "three_card", allow_reversed=False, rng=7)
     profile = analyze_question(
         "How can I nurture my career and creativity this month?"
     )
 
-    engine = InterpretationEngine(TarotKnowledgeBase(deck.all_cards))
+    engine = InterpretationEngine(knowledge_base)
     summary = engine.render_personalised_summary(reading, profile)
 
     assert "Story Arc" in summary
@@ -25,17 +29,62 @@ def test_render_personalised_summary_creates_story_arc():
     assert "chapter of" in summary
 
 
-def test_build_prompt_interpretation_includes_prompt_and_message():
-    deck = TarotDeck()
-    deck.seed(5)
-    deck.reset(shuffle=True)
+def test_build_prompt_interpretation_includes_prompt_and_message(
+    seeded_deck, knowledge_base
+):
+    deck = seeded_deck(5)
     reading = draw_spread(deck, "single", allow_reversed=True, rng=3)
-    knowledge = TarotKnowledgeBase(deck.all_cards)
-
-    narrative = build_prompt_interpretation(reading.placements[0], knowledge)
+    narrative = build_prompt_interpretation(reading.placements[0], knowledge_base)
 
     prompt_text = reading.placements[0].position.prompt.split()[0]
 
     assert reading.placements[0].card.card.name in narrative
     assert prompt_text in narrative
     assert "In " in narrative
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+def test_personalized_insight_uses_slots():
+    insight = PersonalizedInsight(
+        placement_index=1,
+        title="Past",
+        card_name="The Star",
+        orientation="Upright",
+        prompt="What history is influencing the situation?",
+        message="Hope returns.",
+    )
+
+    assert not hasattr(insight, "__dict__")
+    assert insight.orientation_lower == "upright"
+    assert insight.prompt_phrase == "what history is influencing the situation?"
+
+
+def test_prompt_interpretation_cache_is_released_with_knowledge_base(
+    seeded_deck, tarot_deck
+):
+    placement = draw_spread(seeded_deck(2), "single", rng=1).placements[0]
+    knowledge = TarotKnowledgeBase(tarot_deck.all_cards)
+    first = build_prompt_interpretation(placement, knowledge)
+    assert build_prompt_interpretation(placement, knowledge) is first
+
+    knowledge_ref = weakref.ref(knowledge)
+    del knowledge
+    gc.collect()
+    assert knowledge_ref() is None
+
+
+def test_prompt_interpretation_does_not_retry_on_type_errors(seeded_deck, tarot_deck):
+    placement = draw_spread(seeded_deck(3), "single", rng=1).placements[0]
+    knowledge = TarotKnowledgeBase(tarot_deck.all_cards)
+
+    calls = []
+
+    def broken_insight(drawn_card, focus):
+        calls.append(focus)
+        raise TypeError("broken insight")
+
+    knowledge.insight_for = broken_insight
+    with pytest.raises(TypeError, match="broken insight"):
+        build_prompt_interpretation(placement, knowledge)
+    # The error surfaces straight away instead of being retried uncached.
+    assert len(calls) == 1
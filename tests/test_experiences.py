@@ -1,15 +1,13 @@
 from tarotteller import (
     ContextProfile,
     DrawnCard,
-    TarotDeck,
     build_immersive_companion,
 )
 
 
-def test_build_immersive_companion_includes_sections():
-    deck = TarotDeck()
-    magician = deck.get_card("The Magician")
-    high_priestess = deck.get_card("The High Priestess")
+def test_build_immersive_companion_includes_sections(tarot_deck):
+    magician = tarot_deck.get_card("The Magician")
+    high_priestess = tarot_deck.get_card("The High Priestess")
     assert magician is not None and high_priestess is not None
 
     cards = [
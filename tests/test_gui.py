@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+from tarotteller.interfaces.gui import (
+    TarotTellerApp,
+    _DrawRequest,
+    _Presentation,
+    _compose_reading,
+    _render_reading,
+)
+
+
+def test_cached_draw_rerenders_only_presentation_sections(seeded_deck, knowledge_base):
+    request = _DrawRequest(
+        card_count=None,
+        spread_key="three_card",
+        question="How can I grow my career?",
+        allow_reversed=True,
+    )
+    plain = _Presentation(detailed=False, immersive=False, tone="radiant")
+    drawn, result = _compose_reading(request, plain, seeded_deck(4), knowledge_base)
+
+    detailed = _render_reading(
+        drawn, _Presentation(detailed=True, immersive=True, tone="mystic")
+    )
+
+    assert drawn.opening in result.text and drawn.opening in detailed.text
+    assert drawn.closing in result.text and drawn.closing in detailed.text
+    assert "Spread: Three Card Story" in detailed.text
+    assert "Tone     : Mystic" in detailed.text
+    assert "Immersive Companion" not in result.text
+    assert detailed.first_card == result.first_card
+
+
+class _FakeText:
+    """Mimics the Text widget's synchronous modified flag without a display."""
+
+    def __init__(self) -> None:
+        self.content = ""
+        self.modified = False
+
+    def insert(self, text: str) -> None:
+        self.content += text
+        self.modified = True
+
+    def get(self, start: str, end: str) -> str:
+        return self.content + "\n"
+
+    def edit_modified(self, flag=None):
+        if flag is None:
+            return self.modified
+        self.modified = flag
+
+
+def test_question_value_sees_edits_before_modified_event_arrives():
+    question = _FakeText()
+    app = SimpleNamespace(question=question, _question_text="", _question_dirty=False)
+
+    question.insert("Will my project thrive?")
+
+    assert TarotTellerApp._question_value(app) == "Will my project thrive?"
+    assert not question.modified
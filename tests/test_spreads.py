@@ -1,4 +1,4 @@
-from tarotteller import SPREADS, TarotDeck, draw_spread
+from tarotteller import SPREADS, draw_spread
 
 
 def test_spread_definitions_have_expected_sizes():
@@ -7,10 +7,8 @@ def test_spread_definitions_have_expected_sizes():
     assert SPREADS["celtic_cross"].size == 10
 
 
-def test_draw_spread_produces_reading():
-    deck = TarotDeck()
-    deck.seed(99)
-    deck.reset(shuffle=True)
+def test_draw_spread_produces_reading(seeded_deck):
+    deck = seeded_deck(99)
     reading = draw_spread(deck, "three_card", rng=21)
     assert len(reading.placements) == 3
     assert reading.placements[0].position.title == "Past"
@@ -23,10 +21,8 @@ def test_draw_spread_produces_reading():
     assert "Past" in text and "Future" in text
 
 
-def test_spread_reading_to_dict_structure():
-    deck = TarotDeck()
-    deck.seed(5)
-    deck.reset(shuffle=True)
+def test_spread_reading_to_dict_structure(seeded_deck):
+    deck = seeded_deck(5)
     reading = draw_spread(deck, "single", rng=8)
     payload = reading.to_dict()
 